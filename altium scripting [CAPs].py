@@ -1,13 +1,38 @@
-import json
+import argparse
 import os
+from contextlib import ExitStack
+from functools import lru_cache
+
+from altium_manifest import ComponentManifest, selection_name
+from altium_library import LibraryWriter, benchmark
+from component_values import format_si, parse_value
+from lcsc_catalog import load_products
+from lcsc_delta import part_key
+from lcsc_stream import find_export
+
+@lru_cache(maxsize=4096)
+def format_value(value_str, unit):
+    """Normalize a value string (4.7µF → 4.7uF, 1000V → 1kV), keeping unparsable ones"""
+    value = parse_value(value_str, unit)
+    return format_si(value, unit) if value is not None else value_str
+
+# Header of the Ultra Librarian file
+LIBRARY_HEADER = '\n'.join([
+    "# Created by Ultra Librarian 8.3.381 Copyright © 1999-2024",
+    "# Frank Frank, Accelerated Designs",
+    "# Modified By Mohamed A. Ebrahem",
+    "",
+    "StartComponents",
+    "",
+])
 
 def create_component_from_json(item):
     """Create a component entry for the Ultra Librarian file from JSON data."""
     
     # Get values, use empty string if key doesn't exist
     package = item.get('Package', '')
-    capacitance = item.get('Capacitance', '')
-    voltage_rating = item.get('Voltage Rating', '')
+    capacitance = format_value(item.get('Capacitance', ''), 'F')
+    voltage_rating = format_value(item.get('Voltage Rating', ''), 'V')
     tolerance = item.get('Tolerance', '').replace('±', '')  # Remove ± if present
     temp_coefficient = item.get('Temperature Coefficient', '')
     supplier_part = item.get('Supplier Part Number', '')
@@ -61,49 +86,75 @@ EndComponent
     return component
 
 def main():
-    # Define input and output paths
-    input_json_path = os.path.join('Outputs', 'JSONs', 'Capacitors-FOJAN.json')
+    parser = argparse.ArgumentParser(description="Generate the Altium capacitor library file")
+    parser.add_argument('--source', choices=['auto', 'catalog', 'parquet', 'json'], default='auto',
+                        help="read Outputs/catalog.sqlite, the Parquet or the JSON export "
+                             "(default: the first one present)")
+    parser.add_argument('--package', action='append',
+                        help="only this package (repeatable), e.g. --package 0603")
+    parser.add_argument('--tolerance', type=float,
+                        help="only this tolerance in percent, e.g. --tolerance 1")
+    parser.add_argument('--input',
+                        help="read this .json, .jsonl[.gz|.zst] or .parquet export (format from the extension)")
+    parser.add_argument('--delta', action='store_true',
+                        help="also write Capacitors.delta.txt with only the components added or changed since "
+                             "the last build and Capacitors.removed.txt with the removed parts")
+    parser.add_argument('--benchmark', type=int, nargs='*', metavar='PARTS',
+                        help="time rendering and writing synthetic parts built from the JSON export "
+                             "instead (default: 5000 100000 1000000)")
+    args = parser.parse_args()
+    
+    # Define input and output paths (the newest JSON export in any format)
+    input_json_path = args.input or find_export(os.path.join('Outputs', 'JSONs'), 'Capacitors-FOJAN')
+    
+    if args.benchmark is not None:
+        benchmark(create_component_from_json, LIBRARY_HEADER, args.benchmark or [5000, 100000, 1000000],
+                  input_json_path)
+        return
+    
     output_folder = os.path.join('Outputs', 'Components')
     
     # Create output folder if it doesn't exist
     os.makedirs(output_folder, exist_ok=True)
     
-    # Check if JSON file exists
-    if not os.path.exists(input_json_path):
-        print(f"Error: JSON file not found at {input_json_path}")
+    # Read the catalog (filtered on its indexes) or the JSON file
+    data = load_products('Capacitors', input_json_path, source='json' if args.input else args.source,
+                         package=args.package, tolerance=args.tolerance)
+    if data is None:
+        print(f"Error: no capacitors in the catalog and JSON file not found at {input_json_path}")
         print("Please make sure to run the scraper first to generate the JSON file.")
         return
-
-    # Read the JSON file
-    with open(input_json_path, 'r', encoding='utf-8') as json_file:
-        data = json.load(json_file)
-    
-    # Start building the output file
-    output_lines = []
-    
-    # Add header
-    output_lines.append("# Created by Ultra Librarian 8.3.381 Copyright © 1999-2024")
-    output_lines.append("# Frank Frank, Accelerated Designs")
-    output_lines.append("# Modified By Mohamed A. Ebrahem")
-    output_lines.append("")
-    output_lines.append("StartComponents")
-    output_lines.append("")
     
-    # Create components for each item in JSON
-    for item in data:
-        component_text = create_component_from_json(item)
-        output_lines.append(component_text)
+    # A --package/--tolerance build gets its own files (Capacitors.0603-1%.txt), the full library is left alone
+    build_name = selection_name('Capacitors', args.package, args.tolerance)
     
-    # Add footer
-    output_lines.append("")
-    output_lines.append("EndComponents")
+    # Component hashes of the last build of this selection, to find what changed since then
+    # (kept once --delta is used)
+    manifest_path = os.path.join('Outputs', 'State', f'{build_name}.components.json')
+    manifest = None
+    if args.delta or os.path.exists(manifest_path):
+        manifest = ComponentManifest(manifest_path, {'package': args.package, 'tolerance': args.tolerance})
     
-    # Write to output file in Outputs folder
-    output_path = os.path.join(output_folder, 'Capacitors.txt')
-    with open(output_path, 'w', encoding='utf-8') as output_file:
-        output_file.write('\n'.join(output_lines))
+    # Stream each component through a buffered writer as its product is read
+    output_path = os.path.join(output_folder, f'{build_name}.txt')
+    delta_path = os.path.join(output_folder, f'{build_name}.delta.txt')
+    with ExitStack() as stack:
+        writer = stack.enter_context(LibraryWriter(output_path, LIBRARY_HEADER))
+        delta_writer = stack.enter_context(LibraryWriter(delta_path, LIBRARY_HEADER)) if args.delta else None
+        for item in data:
+            component = create_component_from_json(item)
+            writer.write(component)
+            if manifest and manifest.record(part_key(item), component) and delta_writer:
+                delta_writer.write(component)
     
-    print(f"Created {len(data)} components in Capacitors.txt")
+    print(f"Created {writer.count} components in {build_name}.txt")
+    if args.delta:
+        manifest.print_summary()
+        removed = manifest.write_removed(os.path.join(output_folder, f'{build_name}.removed.txt'))
+        print(f"Created {len(manifest.added) + len(manifest.changed)} components in {build_name}.delta.txt, "
+              f"{removed} removed parts in {build_name}.removed.txt")
+    if manifest:
+        manifest.save()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Per-component build manifest for the Altium library generators.
+
+A build with --delta records a content hash of each generated component,
+keyed by Supplier Part Number (see lcsc_delta.part_key), in
+Outputs/State/<Library>.components.json, and every later build of the same
+--package/--tolerance selection keeps it up to date (plain builds without a
+manifest skip the hashing):
+
+    {"selection": {"package": ["0603"], "tolerance": null},
+     "components": {"C2906982": ["RES 0603 10k 1%", "3f9c1e0a5b7d2c44"]}}
+
+With --delta the generators also compare against it and write
+Outputs/Components/<Library>.delta.txt, an Ultra Librarian file holding only
+the components added or changed since the last build, and
+<Library>.removed.txt listing the parts that are gone (part number and
+component name, tab separated). Importing the delta file through
+UL_Import.pas takes seconds instead of re-importing the whole library.
+
+Every selection has its own manifest, named by selection_name
+(Outputs/State/Resistors.0603-1%.components.json for --package 0603
+--tolerance 1), so a filtered build never replaces the full library's one.
+A manifest holding another selection anyway is not compared against: every
+component counts as added and none as removed.
+"""
+import hashlib
+import json
+import os
+import re
+
+_NAME_RE = re.compile(r'Component \(Name "([^"]*)"\)')
+
+
+def selection_name(library, package=None, tolerance=None):
+    """Name of a library build for a --package/--tolerance selection ('Resistors', 'Resistors.0402+0603-1%')"""
+    parts = []
+    if package:
+        parts.append('+'.join([package] if isinstance(package, str) else package))
+    if tolerance is not None:
+        parts.append(f'{tolerance:g}%')
+    return f"{library}.{'-'.join(parts)}" if parts else library
+
+
+def component_hash(component):
+    """Short content hash of a component entry"""
+    return hashlib.sha256(component.encode('utf-8')).hexdigest()[:16]
+
+
+class ComponentManifest:
+    """Component hashes of the last library build"""
+
+    def __init__(self, path, selection=None):
+        self.path = path
+        self.selection = selection or {}
+        self.previous = {}
+        self.components = {}
+        self.added = []
+        self.changed = []
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('selection', {}) == self.selection:
+                self.previous = manifest['components']
+            else:
+                print(f"Manifest {path} was built for another selection, comparing against nothing")
+
+    def record(self, key, component):
+        """Remember a generated component; returns True if it is new or changed since the last build"""
+        match = _NAME_RE.match(component)
+        digest = component_hash(component)
+        self.components[key] = [match.group(1) if match else '', digest]
+        previous = self.previous.get(key)
+        if previous is None:
+            self.added.append(key)
+            return True
+        if previous[1] != digest:
+            self.changed.append(key)
+            return True
+        return False
+
+    def removed(self):
+        """(part, component name) of the last build's components that were not generated this time"""
+        return [(key, name) for key, (name, _) in self.previous.items() if key not in self.components]
+
+    def save(self):
+        """Write this build's manifest for the next --delta run"""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'selection': self.selection, 'components': self.components}, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def write_removed(self, path):
+        """Write the removed parts, one 'part<TAB>name' line each; returns how many"""
+        removed = self.removed()
+        with open(path, 'w', encoding='utf-8') as f:
+            for key, name in removed:
+                f.write(f'{key}\t{name}\n')
+        return len(removed)
+
+    def print_summary(self):
+        """Print what changed since the last build"""
+        unchanged = len(self.components) - len(self.added) - len(self.changed)
+        print(f"Delta: {len(self.added)} added, {len(self.changed)} changed, "
+              f"{len(self.removed())} removed, {unchanged} unchanged")
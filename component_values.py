@@ -0,0 +1,148 @@
+"""
+Unit-aware parametric values shared by the scrapers and the Altium generators.
+
+Listing cells and descriptions carry values such as '4.7kΩ', '100nF',
+'1kV', '62.5mW' or '±1%'. This module turns them into SI floats and renders
+them back consistently:
+
+    parse_value('3.32kΩ')          -> 3320.0
+    parse_description('10kΩ ±1% 100mW 0603 Thick Film Resistor')
+        -> {'Resistance': 10000.0, 'Tolerance': 1.0, 'Power': 0.1}
+    rkm_code(3320.0)               -> '3k32'   (2R2, 4k7, 1M, 4u7, 100n ...)
+    format_si(4.7e-6, 'F')         -> '4.7uF'
+
+Every pattern is compiled once and a description is scanned in a single
+pass. Results are memoized, since the same strings repeat thousands of
+times across a catalog.
+"""
+import re
+from functools import lru_cache
+
+SI_PREFIXES = {
+    'p': 1e-12, 'n': 1e-9, 'u': 1e-6, 'µ': 1e-6, 'μ': 1e-6, 'm': 1e-3,
+    '': 1.0, 'k': 1e3, 'K': 1e3, 'M': 1e6, 'G': 1e9,
+}
+
+# Units as written on LCSC -> canonical unit
+UNITS = {
+    'Ω': 'Ω', 'ohm': 'Ω', 'ohms': 'Ω', 'R': 'Ω',
+    'F': 'F', 'f': 'F', 'V': 'V', 'W': 'W', '%': '%',
+}
+
+# Description field of each unit
+DESCRIPTION_FIELDS = {'Ω': 'Resistance', 'F': 'Capacitance', 'V': 'Voltage Rating', 'W': 'Power'}
+
+# Rendering prefixes, smallest first ('u' rather than 'µ' to match the listing)
+_RENDER_PREFIXES = (('p', 1e-12), ('n', 1e-9), ('u', 1e-6), ('m', 1e-3), ('', 1.0),
+                    ('k', 1e3), ('M', 1e6), ('G', 1e9))
+
+_QUANTITY_RE = re.compile(
+    r'(?P<tolerance>±\s*)?(?P<number>\d+(?:\.\d+)?)\s*(?P<prefix>[pnuµμmkKMG]?)'
+    r'(?P<unit>Ω|ohms?|[Ff]|V|W|%)(?![A-Za-z])'
+)
+_RKM_RE = re.compile(r'^(?P<whole>\d*)(?P<letter>[RpnuµμmkKMG])(?P<fraction>\d*)(?P<unit>Ω|F)?$')
+_DIELECTRIC_RE = re.compile(r'\b(X[5-8][RSTUM]|Y5V|Z5U|C0G|COG|NP0|NPO|SL|XH)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def parse_quantity(text):
+    """Return (SI value, canonical unit) for one value string, or None"""
+    if not text:
+        return None
+    text = text.strip()
+    match = _QUANTITY_RE.fullmatch(text)
+    if match:
+        unit = UNITS[match.group('unit')]
+        return float(match.group('number')) * SI_PREFIXES[match.group('prefix')], unit
+
+    # RKM codes: 4k7, 2R2, 100n, 4u7F
+    match = _RKM_RE.match(text)
+    if match and (match.group('whole') or match.group('fraction')):
+        letter = match.group('letter')
+        number = float(f"{match.group('whole') or 0}.{match.group('fraction') or 0}")
+        if letter == 'R':
+            return number, 'Ω'
+        unit = UNITS[match.group('unit')] if match.group('unit') else ('F' if letter in 'pnuµμ' else 'Ω')
+        return number * SI_PREFIXES[letter], unit
+    return None
+
+
+def parse_value(text, unit=None):
+    """Return the SI value of a value string (None if unparsable or not in `unit`)"""
+    quantity = parse_quantity(text)
+    if quantity is None or (unit is not None and quantity[1] != UNITS.get(unit, unit)):
+        return None
+    return quantity[0]
+
+
+@lru_cache(maxsize=65536)
+def _parse_description(description):
+    values = {}
+    for match in _QUANTITY_RE.finditer(description):
+        unit = UNITS[match.group('unit')]
+        if unit == '%':
+            if match.group('tolerance'):
+                values.setdefault('Tolerance', float(match.group('number')))
+            continue
+        field = DESCRIPTION_FIELDS[unit]
+        values.setdefault(field, float(match.group('number')) * SI_PREFIXES[match.group('prefix')])
+    dielectric = _DIELECTRIC_RE.search(description)
+    if dielectric:
+        values['Temperature Coefficient'] = dielectric.group(1).upper()
+    return tuple(values.items())
+
+
+def parse_description(description):
+    """Return the resistance, capacitance, voltage, power (SI floats), tolerance (%)
+    and dielectric found in a product description"""
+    if not description:
+        return {}
+    return dict(_parse_description(description))
+
+
+def _scale(value):
+    """Return (prefix, scaled value) with 1 <= scaled < 1000 where possible"""
+    magnitude = abs(value)
+    chosen = _RENDER_PREFIXES[0]
+    for prefix, factor in _RENDER_PREFIXES:
+        if magnitude >= factor * (1 - 1e-9):
+            chosen = (prefix, factor)
+    return chosen[0], value / chosen[1]
+
+
+def _digits(number):
+    text = f'{number:.4g}'
+    if 'e' in text:
+        text = f'{number:.4f}'.rstrip('0').rstrip('.')
+    return text
+
+
+@lru_cache(maxsize=4096)
+def format_si(value, unit):
+    """Render an SI value with a prefix: 4.7e-06, 'F' -> '4.7uF'"""
+    if value is None:
+        return ''
+    if value == 0:
+        return f'0{unit}'
+    if unit == '%':
+        return f'{_digits(value)}%'
+    prefix, scaled = _scale(value)
+    return f'{_digits(scaled)}{prefix}{unit}'
+
+
+@lru_cache(maxsize=4096)
+def rkm_code(value, unit='Ω'):
+    """Render an RKM (IEC 60062) code: 2.2 -> '2R2', 4700 -> '4k7', 1e6 -> '1M', 4.7e-6 F -> '4u7'"""
+    if value is None:
+        return ''
+    unit = UNITS.get(unit, unit)
+    if unit == 'Ω' and abs(value) < 1:
+        prefix, scaled = '', value
+    else:
+        prefix, scaled = _scale(value)
+    letter = prefix or ('R' if unit == 'Ω' else unit)
+    digits = _digits(scaled)
+    if '.' in digits:
+        whole, fraction = digits.split('.')
+        return f'{whole}{letter}{fraction}'
+    return f'{digits}{letter}'
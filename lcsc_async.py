@@ -0,0 +1,158 @@
+"""
+asyncio crawl engine for the LCSC scrapers.
+
+Replaces fixed sleeps with adaptive politeness:
+- a token bucket per host caps the request rate
+- an AIMD controller raises concurrency by one while latency stays under
+  target and halves it on 429/5xx responses or timeouts
+
+Requests go through the pooled LCSCHttpBackend session on executor threads,
+so no extra HTTP dependency is needed.
+"""
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from lcsc_http import LCSCHttpBackend
+
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, up to `capacity` stored"""
+
+    def __init__(self, rate=1.0, capacity=2):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease concurrency limit"""
+
+    def __init__(self, initial=2, minimum=1, maximum=16, latency_target=3.0, decrease_factor=0.5):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.increases = 0
+        self.decreases = 0
+        self._successes = 0
+
+    def on_success(self, latency):
+        """Grow by one slot per full window of fast answers"""
+        if latency > self.latency_target:
+            self.on_throttle()
+            return
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self.increases += 1
+            self._successes = 0
+
+    def on_throttle(self):
+        """Back off multiplicatively on throttling, errors or slow answers"""
+        new_limit = max(self.minimum, int(self.limit * self.decrease_factor))
+        if new_limit < self.limit:
+            self.decreases += 1
+        self.limit = new_limit
+        self._successes = 0
+
+
+class AsyncCrawlEngine:
+    """Fetch many urls concurrently under a token bucket and AIMD limit"""
+
+    def __init__(self, rate=1.0, burst=2, initial_concurrency=2, max_concurrency=8,
+                 latency_target=3.0, max_attempts=4, backend=None):
+        self.rate = rate
+        self.burst = burst
+        self.max_attempts = max_attempts
+        self.controller = AIMDController(initial_concurrency, 1, max_concurrency, latency_target)
+        self.backend = backend or LCSCHttpBackend(pool_size=max_concurrency, retries=0, min_interval=0)
+        self.buckets = {}
+        self.in_flight = 0
+        self.latencies = []
+        self.throttle_events = 0
+        self._slot_changed = None
+
+    def bucket_for(self, url):
+        """Return the token bucket of the url's host"""
+        host = urlsplit(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    async def _acquire_slot(self):
+        async with self._slot_changed:
+            await self._slot_changed.wait_for(lambda: self.in_flight < self.controller.limit)
+            self.in_flight += 1
+
+    async def _release_slot(self):
+        async with self._slot_changed:
+            self.in_flight -= 1
+            self._slot_changed.notify_all()
+
+    async def fetch(self, url):
+        """Fetch one url with retries; returns the page text or None"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(1, self.max_attempts + 1):
+            await self._acquire_slot()
+            await self.bucket_for(url).acquire()
+            started = time.monotonic()
+            try:
+                status, text = await loop.run_in_executor(None, self.backend.fetch_response, url)
+            finally:
+                await self._release_slot()
+            latency = time.monotonic() - started
+
+            if status is not None and status not in THROTTLE_STATUSES:
+                self.latencies.append(latency)
+                self.controller.on_success(latency)
+                return text if status == 200 else None
+
+            self.throttle_events += 1
+            self.controller.on_throttle()
+            print(f"⚠️ Throttled ({status or 'timeout'}) on {url}, "
+                  f"concurrency now {self.controller.limit} (attempt {attempt})")
+            await asyncio.sleep(min(30, 2 ** attempt))
+        return None
+
+    async def crawl(self, urls):
+        """Yield (index, text) for every url, in the original order"""
+        self._slot_changed = asyncio.Condition()
+        self.buckets = {}
+        tasks = [asyncio.ensure_future(self.fetch(url)) for url in urls]
+        try:
+            for index, task in enumerate(tasks):
+                yield index, await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def print_stats(self):
+        """Print the engine's latency and concurrency statistics"""
+        if self.latencies:
+            average = sum(self.latencies) / len(self.latencies)
+            print(f"⏱️ Average latency: {average:.2f}s over {len(self.latencies)} requests")
+        print(f"🔧 Final concurrency: {self.controller.limit} "
+              f"(+{self.controller.increases} / -{self.controller.decreases}), "
+              f"throttle events: {self.throttle_events}")
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.backend.close()
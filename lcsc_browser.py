@@ -0,0 +1,218 @@
+"""
+Selenium helpers shared by the LCSC scrapers.
+
+PageReadyWaiter replaces fixed sleeps with event-driven waits: a page turn
+is done as soon as the old product rows go stale (or the first productId
+changes) and the new rows are present, optionally followed by a short
+network-idle check. Every wait is timed so slow transitions show up in the
+crawl summary.
+
+ResourceFilter blocks assets the scrapers never read (images, fonts,
+stylesheets, media, trackers) through the Chrome DevTools protocol and
+reports the requests and bytes saved per page. The first page is loaded
+unfiltered as a baseline for the average size of each resource type.
+"""
+import argparse
+import json
+import threading
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+PRODUCT_ROW_SELECTOR = "tr[id*='productId']"
+
+RESOURCE_COUNT_SCRIPT = "return performance.getEntriesByType('resource').length"
+
+RESOURCE_BLOCKLISTS = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'stylesheets': ['*.css'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.m3u8'],
+    'trackers': ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+                 '*facebook.net*', '*hotjar.com*', '*clarity.ms*', '*hm.baidu.com*'],
+}
+
+
+class PageReadyWaiter:
+    """Event-driven waits for the LCSC product table"""
+
+    def __init__(self, driver, timeout=15, poll_frequency=0.1, network_idle=False, idle_time=0.5):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.network_idle = network_idle
+        self.idle_time = idle_time
+        self.wait_times = []
+
+    def first_row(self):
+        """Return (element, id) of the first product row, or (None, None)"""
+        rows = self.driver.find_elements(By.CSS_SELECTOR, PRODUCT_ROW_SELECTOR)
+        if not rows:
+            return None, None
+        try:
+            return rows[0], rows[0].get_attribute('id')
+        except StaleElementReferenceException:
+            return None, None
+
+    def wait_for_rows(self, label='initial load'):
+        """Wait until product rows are present; returns True on success"""
+        started = time.perf_counter()
+        try:
+            WebDriverWait(self.driver, self.timeout, self.poll_frequency).until(
+                lambda driver: driver.find_elements(By.CSS_SELECTOR, PRODUCT_ROW_SELECTOR)
+            )
+        except TimeoutException:
+            return False
+        self._settle()
+        self.record(label, time.perf_counter() - started)
+        return True
+
+    def wait_for_replacement(self, old_row, old_id, label='page turn'):
+        """Wait until the table rows seen before a page turn have been replaced"""
+        started = time.perf_counter()
+
+        def table_replaced(driver):
+            if old_row is not None:
+                try:
+                    old_row.is_enabled()
+                except StaleElementReferenceException:
+                    return bool(driver.find_elements(By.CSS_SELECTOR, PRODUCT_ROW_SELECTOR))
+            _, current_id = self.first_row()
+            return current_id is not None and current_id != old_id
+
+        try:
+            WebDriverWait(self.driver, self.timeout, self.poll_frequency).until(table_replaced)
+        except TimeoutException:
+            return False
+        self._settle()
+        self.record(label, time.perf_counter() - started)
+        return True
+
+    def _settle(self):
+        """Optionally wait until no new network resources load for idle_time seconds"""
+        if not self.network_idle:
+            return
+        state = {'count': -1, 'since': time.perf_counter()}
+
+        def network_idle(driver):
+            count = driver.execute_script(RESOURCE_COUNT_SCRIPT)
+            now = time.perf_counter()
+            if count != state['count']:
+                state['count'] = count
+                state['since'] = now
+                return False
+            return now - state['since'] >= self.idle_time
+
+        try:
+            WebDriverWait(self.driver, self.timeout, self.poll_frequency).until(network_idle)
+        except TimeoutException:
+            pass
+
+    def record(self, label, seconds):
+        """Store one measured wait"""
+        self.wait_times.append((label, seconds))
+
+    def print_summary(self):
+        """Print wait time statistics for page transitions"""
+        turns = [seconds for label, seconds in self.wait_times if label == 'page turn']
+        loads = [seconds for label, seconds in self.wait_times if label != 'page turn']
+        if loads:
+            print(f"⏱️ Initial load wait: {sum(loads) / len(loads):.2f}s")
+        if turns:
+            print(f"⏱️ Page turn wait: avg {sum(turns) / len(turns):.2f}s, "
+                  f"min {min(turns):.2f}s, max {max(turns):.2f}s over {len(turns)} turns")
+
+
+def parse_block_categories(value):
+    """argparse type for --block: 'none', 'all' or a comma separated list of categories"""
+    if value == 'none':
+        return []
+    if value == 'all':
+        return list(RESOURCE_BLOCKLISTS)
+    categories = [category.strip() for category in value.split(',') if category.strip()]
+    unknown = [category for category in categories if category not in RESOURCE_BLOCKLISTS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown resource categories {unknown}, choose from {', '.join(RESOURCE_BLOCKLISTS)}")
+    return categories
+
+
+class ResourceFilter:
+    """Block unneeded page resources via CDP and measure what was saved"""
+
+    def __init__(self, categories):
+        self.categories = categories
+        self.patterns = [pattern for category in categories for pattern in RESOURCE_BLOCKLISTS[category]]
+        self.type_sizes = None
+        self.pages = 0
+        self.blocked_requests = 0
+        self.saved_bytes = 0
+        self.loaded_requests = 0
+        self.loaded_bytes = 0
+        self._lock = threading.Lock()
+
+    def configure(self, chrome_options):
+        """Enable the performance log the per-page report is read from"""
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    def apply(self, driver):
+        """Start blocking the configured url patterns in this browser"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns})
+
+    @staticmethod
+    def collect(driver):
+        """Drain the performance log into loaded/blocked request counts and bytes per resource type"""
+        types = {}
+        loaded = {}
+        blocked = {}
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                types[params['requestId']] = params.get('type', 'Other')
+            elif method == 'Network.loadingFinished':
+                resource_type = types.get(params['requestId'], 'Other')
+                count, size = loaded.get(resource_type, (0, 0))
+                loaded[resource_type] = (count + 1, size + params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                resource_type = params.get('type') or types.get(params['requestId'], 'Other')
+                blocked[resource_type] = blocked.get(resource_type, 0) + 1
+        return loaded, blocked
+
+    def report_page(self, driver, page):
+        """Print the requests and bytes saved on one page (the first page calibrates sizes)"""
+        loaded, blocked = self.collect(driver)
+        loaded_requests = sum(count for count, _ in loaded.values())
+        loaded_bytes = sum(size for _, size in loaded.values())
+
+        with self._lock:
+            if self.type_sizes is None:
+                self.type_sizes = {resource_type: size / count
+                                   for resource_type, (count, size) in loaded.items() if count}
+                self.apply(driver)
+                print(f"🪶 Page {page} loaded unfiltered as baseline: {loaded_requests} requests, "
+                      f"{loaded_bytes / 1024:.0f} KB; blocking {', '.join(self.categories)} from now on")
+                return
+
+            blocked_requests = sum(blocked.values())
+            saved_bytes = sum(self.type_sizes.get(resource_type, 0) * count
+                              for resource_type, count in blocked.items())
+            self.pages += 1
+            self.blocked_requests += blocked_requests
+            self.saved_bytes += saved_bytes
+            self.loaded_requests += loaded_requests
+            self.loaded_bytes += loaded_bytes
+        print(f"🪶 Page {page}: blocked {blocked_requests} requests (~{saved_bytes / 1024:.0f} KB saved), "
+              f"loaded {loaded_requests} requests ({loaded_bytes / 1024:.0f} KB)")
+
+    def print_summary(self):
+        """Print total savings over the filtered pages"""
+        if not self.pages:
+            return
+        print(f"🪶 Resource filter: {self.blocked_requests} requests blocked "
+              f"(~{self.saved_bytes / 1024 / 1024:.1f} MB saved) over {self.pages} pages, "
+              f"{self.loaded_bytes / 1024 / 1024:.1f} MB still loaded")
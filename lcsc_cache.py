@@ -0,0 +1,135 @@
+"""
+On-disk cache of fetched listing pages for the LCSC scrapers.
+
+Entries are addressed by a SHA-256 of the normalized url (scheme and host
+lower-cased, query parameters sorted, fragment dropped) plus the entry
+kind:
+
+- 'page'        page source HTML
+- 'records'     row records from the in-page extraction script (JSON)
+- 'page-count'  number of pages the listing had on the last full crawl
+
+Each entry is a small gzip file. Entries older than the TTL are dropped on
+read and the least recently used ones are evicted once the cache grows past
+max_bytes. Re-running a scraper with --cache replays cached pages in seconds,
+and --offline runs the whole pipeline from the cache without a browser.
+
+One PageCache is shared by the parallel browser workers: the size
+bookkeeping and eviction run under a lock, and an entry another thread has
+just evicted or replaced is treated as gone.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+def normalize_url(url):
+    """Normalize a url so equivalent listing urls share one cache entry"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+class PageCache:
+    """TTL + size-bounded LRU cache of listing pages on disk"""
+
+    def __init__(self, folder, ttl=24 * 3600, max_bytes=512 * 1024 * 1024):
+        self.folder = folder
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True)
+        self.total_bytes = sum(size for _, _, size in self._entries())
+
+    def _path(self, url, kind):
+        key = hashlib.sha256(f'{kind}\n{normalize_url(url)}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.folder, f'{key}.json.gz')
+
+    def _entries(self):
+        for entry in os.scandir(self.folder):
+            if entry.name.endswith('.json.gz'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Evicted or replaced by another thread since the scan started
+                    continue
+                yield entry.path, stat.st_mtime, stat.st_size
+
+    def get(self, url, kind='page'):
+        """Return the cached text for url, or None on a miss or expired entry"""
+        path = self._path(url, kind)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if self.ttl and time.time() - entry['stored'] > self.ttl:
+                self._remove(path)
+                self.misses += 1
+                return None
+
+            # Touch the file so eviction sees it as recently used (unless it was just evicted)
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+            self.hits += 1
+        return entry['data']
+
+    def put(self, url, data, kind='page'):
+        """Store text for url and evict old entries if over the size cap"""
+        path = self._path(url, kind)
+        entry = {'url': url, 'kind': kind, 'stored': time.time(), 'data': data}
+        # Compressed outside the lock, into a temp file of this thread
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        size = os.path.getsize(temp_path)
+
+        with self._lock:
+            try:
+                self.total_bytes -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, path)
+            self.total_bytes += size
+
+            if self.total_bytes > self.max_bytes:
+                self._evict(keep=path)
+
+    def _remove(self, path):
+        # Called with the lock held
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        self.total_bytes -= size
+
+    def _evict(self, keep=None):
+        """Drop least recently used entries until under max_bytes (called with the lock held)"""
+        for path, _, _ in sorted(self._entries(), key=lambda entry: entry[1]):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            self.evictions += 1
+
+    def print_stats(self):
+        """Print hit/miss/eviction counters"""
+        lookups = self.hits + self.misses
+        hit_rate = (self.hits / lookups * 100) if lookups else 0
+        print(f"🗄️ Page cache: {self.hits} hits, {self.misses} misses ({hit_rate:.0f}% hit rate), "
+              f"{self.evictions} evictions, {self.total_bytes / 1024 / 1024:.1f} MB on disk")
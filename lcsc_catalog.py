@@ -0,0 +1,314 @@
+"""
+SQLite catalog store, the system of record for scraped products.
+
+Every category gets one table in Outputs/catalog.sqlite. A row keeps the
+full product (as JSON, with its key order) plus indexed numeric columns
+parsed with component_values, so generators can ask for e.g. only 0603 1%
+parts instead of loading a whole JSON export:
+
+    catalog = Catalog()
+    for product in catalog.products('Resistors', package='0603', tolerance=1):
+        ...
+
+The scrapers upsert every page in one transaction while they crawl (see
+CatalogWriter). After a complete crawl, parts that are no longer listed
+for that brand are removed. The time a crawl's exports were saved is kept
+per category and brand (crawl_runs table), so the generators can tell when
+a JSON export is newer than the catalog, e.g. after a --no-catalog crawl.
+JSON/CSV/Excel are derived exports and can be rebuilt from the catalog:
+
+    python lcsc_catalog.py import Outputs/JSONs/Resistors-FOJAN.json Resistors FOJAN
+    python lcsc_catalog.py export Resistors FOJAN out.json    (or out.jsonl.gz)
+"""
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from itertools import islice
+
+from component_values import parse_value
+from lcsc_delta import part_key
+from lcsc_parquet import PARQUET_AVAILABLE, iter_products as iter_parquet
+from lcsc_stream import export_name, iter_products, json_writer
+from product_records import Product, json_default
+
+CATALOG_PATH = os.path.join('Outputs', 'catalog.sqlite')
+
+# Product field holding the main value of a category, with its unit
+VALUE_FIELDS = (('Resistance', 'Ω'), ('Capacitance', 'F'))
+
+_COLUMNS = ('part', 'brand', 'position', 'run', 'manufacturer_part', 'package',
+            'value', 'tolerance', 'voltage', 'power', 'data')
+
+
+def _table(category):
+    return '"' + re.sub(r'\W', '_', category) + '"'
+
+
+def catalog_row(product, brand, position, run):
+    """Return the column values of a product row"""
+    value = None
+    for field, unit in VALUE_FIELDS:
+        if product.get(field):
+            value = parse_value(product[field], unit)
+            break
+    return (part_key(product), brand, position, run, product.get('Manufacturer Part Number'),
+            product.get('Package'), value, parse_value(product.get('Tolerance'), '%'),
+            parse_value(product.get('Voltage Rating'), 'V'), parse_value(product.get('Power'), 'W'),
+            json.dumps(product, ensure_ascii=False, default=json_default))
+
+
+class Catalog:
+    """SQLite catalog with one indexed table per category"""
+
+    def __init__(self, path=CATALOG_PATH):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        # Scheduler jobs each open their own connection to the same file
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        with self.db:
+            self.db.execute('''CREATE TABLE IF NOT EXISTS crawl_runs (
+                category TEXT NOT NULL,
+                brand TEXT NOT NULL,
+                saved REAL NOT NULL,
+                PRIMARY KEY (category, brand))''')
+        self._tables = set()
+
+    def ensure_table(self, category):
+        """Create a category table and its indexes on first use"""
+        if category in self._tables:
+            return
+        table = _table(category)
+        name = table.strip('"')
+        with self.db:
+            self.db.execute(f'''CREATE TABLE IF NOT EXISTS {table} (
+                part TEXT PRIMARY KEY,
+                brand TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                run REAL NOT NULL,
+                manufacturer_part TEXT,
+                package TEXT,
+                value REAL,
+                tolerance REAL,
+                voltage REAL,
+                power REAL,
+                data TEXT NOT NULL)''')
+            for column in ('package', 'value', 'tolerance', 'voltage'):
+                self.db.execute(f'CREATE INDEX IF NOT EXISTS "{name}_{column}" ON {table} ({column})')
+            self.db.execute(f'CREATE INDEX IF NOT EXISTS "{name}_brand" ON {table} (brand, position)')
+        self._tables.add(category)
+
+    def has_category(self, category):
+        """True if the catalog holds products of a category"""
+        found = self.db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                                (re.sub(r'\W', '_', category),)).fetchone()
+        return found is not None and self.db.execute(f'SELECT 1 FROM {_table(category)} LIMIT 1').fetchone() is not None
+
+    def upsert(self, category, rows):
+        """Insert or update catalog rows (see catalog_row) in one transaction"""
+        self.ensure_table(category)
+        columns = ', '.join(_COLUMNS)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in _COLUMNS[1:])
+        with self.db:
+            self.db.executemany(f'INSERT INTO {_table(category)} ({columns}) '
+                                f'VALUES ({", ".join("?" * len(_COLUMNS))}) '
+                                f'ON CONFLICT(part) DO UPDATE SET {updates}', rows)
+
+    def prune(self, category, brand, run):
+        """Remove a brand's parts that the crawl `run` did not list; returns how many"""
+        self.ensure_table(category)
+        with self.db:
+            return self.db.execute(f'DELETE FROM {_table(category)} WHERE brand = ? AND run != ?',
+                                   (brand, run)).rowcount
+
+    def mark_saved(self, category, brand):
+        """Record that a crawl of category/brand finished writing its exports"""
+        with self.db:
+            self.db.execute('INSERT INTO crawl_runs (category, brand, saved) VALUES (?, ?, ?) '
+                            'ON CONFLICT(category, brand) DO UPDATE SET saved = excluded.saved',
+                            (category, brand, time.time()))
+
+    def saved_at(self, category, brand):
+        """Time the last crawl of category/brand saved its exports (None if not recorded)"""
+        row = self.db.execute('SELECT saved FROM crawl_runs WHERE category = ? AND brand = ?',
+                              (category, brand)).fetchone()
+        return row[0] if row else None
+
+    def products(self, category, brand=None, package=None, tolerance=None,
+                 min_value=None, max_value=None, min_voltage=None):
+        """Yield the category's products in listing order, filtered on the indexed columns.
+
+        package may be one package or a list of them; tolerance is in
+        percent and the values are SI (ohms, farads, volts).
+        """
+        self.ensure_table(category)
+        conditions = []
+        params = []
+        if brand is not None:
+            conditions.append('brand = ?')
+            params.append(brand)
+        if package is not None:
+            packages = [package] if isinstance(package, str) else list(package)
+            conditions.append(f'package IN ({", ".join("?" * len(packages))})')
+            params += packages
+        for column, operator, value in (('tolerance', '=', tolerance), ('value', '>=', min_value),
+                                        ('value', '<=', max_value), ('voltage', '>=', min_voltage)):
+            if value is not None:
+                conditions.append(f'{column} {operator} ?')
+                params.append(value)
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        cursor = self.db.execute(f'SELECT data FROM {_table(category)} {where} ORDER BY brand, position', params)
+        for (data,) in cursor:
+            yield json.loads(data, object_pairs_hook=Product)
+
+    def writer(self, category, brand):
+        """Return a CatalogWriter for one crawl of a category and brand"""
+        return CatalogWriter(self, category, brand)
+
+    def close(self):
+        """Close the database"""
+        self.db.close()
+
+
+class CatalogWriter:
+    """Upsert one crawl's products page by page (same interface as the lcsc_stream writers)"""
+
+    def __init__(self, catalog, category, brand):
+        self.catalog = catalog
+        self.category = category
+        self.brand = brand
+        self.run = time.time()
+        self.count = 0
+
+    def write(self, products):
+        """Upsert one page of products in a single transaction"""
+        rows = [catalog_row(product, self.brand, self.count + offset, self.run)
+                for offset, product in enumerate(products)]
+        if rows:
+            self.catalog.upsert(self.category, rows)
+            self.count += len(rows)
+
+    def close(self, commit=True):
+        """Nothing to finish, every page is committed as it is written"""
+        return True
+
+    def mark_saved(self):
+        """Record that this crawl's exports were written (they are not newer than the catalog)"""
+        self.catalog.mark_saved(self.category, self.brand)
+
+    def prune(self):
+        """After a complete crawl, drop the brand's parts that are no longer listed"""
+        removed = self.catalog.prune(self.category, self.brand, self.run)
+        print(f"🗄️ Catalog: {self.count} {self.category} upserted, {removed} no longer listed removed")
+
+
+def load_products(category, json_path, source='auto', brand='FOJAN', catalog_path=CATALOG_PATH, **filters):
+    """Return an iterator over a category's products for the generators, filtered like Catalog.products.
+
+    source 'auto' reads the catalog when it holds the category, then the
+    Parquet export next to the JSON one (Outputs/Parquets/<name>.parquet),
+    and falls back to the JSON export (any format lcsc_stream.iter_products
+    reads, filtered in Python). The catalog and the Parquet export are
+    skipped when the JSON export is newer than them. Products are read one
+    at a time. Returns None when the requested source does not exist.
+    """
+    if source in ('auto', 'catalog') and os.path.exists(catalog_path):
+        catalog = Catalog(catalog_path)
+        saved = catalog.saved_at(category, brand)
+        # A crawl without the catalog (--no-catalog) or a replaced export leaves the catalog behind
+        stale = (source == 'auto' and os.path.exists(json_path)
+                 and (saved is None or os.path.getmtime(json_path) > saved))
+        if catalog.has_category(category) and stale:
+            print(f"{catalog_path} is older than {json_path}, not reading {category} from it")
+        elif catalog.has_category(category):
+            print(f"Reading {category} from {catalog_path}")
+            return _closing(catalog, catalog.products(category, brand, **filters))
+        catalog.close()
+    if source in ('auto', 'parquet'):
+        parquet_path = os.path.join(os.path.dirname(os.path.dirname(json_path)), 'Parquets',
+                                    f'{export_name(json_path)}.parquet')
+        # A crawl without --parquet leaves an older Parquet export behind
+        stale = (source == 'auto' and os.path.exists(parquet_path) and os.path.exists(json_path)
+                 and os.path.getmtime(parquet_path) < os.path.getmtime(json_path))
+        if PARQUET_AVAILABLE and os.path.exists(parquet_path) and not stale:
+            print(f"Reading {category} from {parquet_path}")
+            return iter_parquet(parquet_path, **filters)
+        if source == 'parquet':
+            if not PARQUET_AVAILABLE:
+                print("Reading Parquet exports requires pyarrow (pip install pyarrow)")
+            return None
+    if source == 'catalog' or not os.path.exists(json_path):
+        return None
+
+    print(f"Reading {category} from {json_path}")
+    products = iter_products(json_path)
+    if not any(value is not None for value in filters.values()):
+        return products
+    return (product for product in products if _matches(catalog_row(product, brand, 0, 0), **filters))
+
+
+def _closing(catalog, products):
+    # Keep the catalog open while the generator reads its rows
+    try:
+        yield from products
+    finally:
+        catalog.close()
+
+
+def _matches(row, package=None, tolerance=None, min_value=None, max_value=None, min_voltage=None):
+    columns = dict(zip(_COLUMNS, row))
+    if package is not None and columns['package'] not in ([package] if isinstance(package, str) else package):
+        return False
+    for column, test, limit in (('tolerance', float.__eq__, tolerance), ('value', float.__ge__, min_value),
+                                ('value', float.__le__, max_value), ('voltage', float.__ge__, min_voltage)):
+        if limit is not None and (columns[column] is None or not test(columns[column], float(limit))):
+            return False
+    return True
+
+
+def import_json(path, category, brand, catalog_path=CATALOG_PATH):
+    """Load a JSON / JSON Lines export into the catalog (e.g. to seed it from committed snapshots)"""
+    catalog = Catalog(catalog_path)
+    try:
+        writer = catalog.writer(category, brand)
+        products = iter_products(path)
+        # One transaction per batch, without loading the whole export
+        while batch := list(islice(products, 500)):
+            writer.write(batch)
+        writer.prune()
+        writer.mark_saved()
+    finally:
+        catalog.close()
+
+
+def export_json(category, brand, path, catalog_path=CATALOG_PATH):
+    """Write a brand's catalog products as a JSON or JSON Lines export (same layout as the scrapers)"""
+    catalog = Catalog(catalog_path)
+    writer = json_writer(path)
+    try:
+        products = catalog.products(category, brand)
+        while batch := list(islice(products, 500)):
+            writer.write(batch)
+    except BaseException:
+        writer.close(commit=False)
+        raise
+    finally:
+        catalog.close()
+    if writer.close():
+        print(f"✓ Exported {writer.count} {category} to {path}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == 'import':
+        import_json(sys.argv[2], sys.argv[3], sys.argv[4])
+    elif len(sys.argv) == 5 and sys.argv[1] == 'export':
+        export_json(sys.argv[2], sys.argv[3], sys.argv[4])
+    else:
+        print("Usage: python lcsc_catalog.py import <export.json> <Category> <Brand>")
+        print("       python lcsc_catalog.py export <Category> <Brand> <export.json>")
+        sys.exit(1)
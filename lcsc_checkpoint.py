@@ -0,0 +1,80 @@
+"""
+Crash-safe crawl checkpoints for the LCSC scrapers.
+
+Every completed page is appended to a JSON Lines log together with the
+crawl cursor (the page number) and flushed to disk, so a crashed crawl can
+be resumed with --resume instead of starting again from page 1:
+
+    {"type": "start", "url": "...", "started": "2024-01-01T10:00:00"}
+    {"type": "page", "page": 1, "products": [...]}
+    {"type": "page", "page": 2, "products": [...]}
+
+A half-written last line (crash during a write) is ignored on load.
+"""
+import json
+import os
+from datetime import datetime
+
+from product_records import json_default
+
+
+class CrawlCheckpoint:
+    """Append-only JSON Lines log of completed pages"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def start(self, url):
+        """Begin a fresh log for url (any previous log is replaced)"""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            self._write(f, {'type': 'start', 'url': url, 'started': datetime.now().isoformat(timespec='seconds')})
+
+    def record_page(self, page, products):
+        """Durably append one completed page"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            self._write(f, {'type': 'page', 'page': page, 'products': products})
+
+    def load(self):
+        """Return (url, last_page, products) from the log"""
+        url = None
+        last_page = 0
+        products = []
+        valid_length = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line.decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    break
+                valid_length += len(line)
+                if entry['type'] == 'start':
+                    url = entry['url']
+                elif entry['type'] == 'page':
+                    last_page = entry['page']
+                    products.extend(entry['products'])
+
+        # Cut off a half-written line so resumed pages append cleanly
+        if valid_length < os.path.getsize(self.path):
+            print("⚠️ Dropping incomplete last checkpoint line")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_length)
+        return url, last_page, products
+
+    def clear(self):
+        """Remove the log once its results are safely exported"""
+        if self.exists():
+            os.remove(self.path)
+
+    @staticmethod
+    def _write(f, entry):
+        f.write(json.dumps(entry, ensure_ascii=False, default=json_default) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
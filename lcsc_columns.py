@@ -0,0 +1,75 @@
+"""
+Header-driven column mapping for the LCSC listing table.
+
+Instead of fixed cell indexes, each scraper declares the columns it reads
+by header name:
+
+    COLUMNS = {
+        'Package': (('Package', 'Pkg.'), 6),
+        'Resistance': (('Resistance',), 10),
+    }
+
+Every entry lists the header names to look for (first match wins) and the
+legacy cell index, which is only used until a table header has been read
+(e.g. row records cached before cell positions were recorded).
+
+The header is read once per page. Every scraper keeps its own name ->
+column map (scheduler jobs crawl the same category for several brands on
+parallel threads), which is only rebuilt when the header changes, so a
+reordered table is picked up on the next page instead of silently
+shifting values.
+"""
+
+
+def _normalize(name):
+    return ' '.join(name.split()).lower()
+
+
+class ColumnMap:
+    """Map a category's fields to table columns using the listing header"""
+
+    def __init__(self, category, columns):
+        self.category = category
+        self.columns = columns
+        self.header = None
+        self.positions = None
+        self.rebuilds = 0
+
+    def update(self, header):
+        """Rebuild the map when this page's header differs from the cached one"""
+        if not header:
+            return
+        header = tuple(header)
+        if header == self.header:
+            return
+
+        header_positions = {}
+        for position, name in enumerate(header):
+            header_positions.setdefault(_normalize(name), position)
+
+        positions = {}
+        missing = []
+        for field, (names, _) in self.columns.items():
+            for name in names:
+                if _normalize(name) in header_positions:
+                    positions[field] = header_positions[_normalize(name)]
+                    break
+            else:
+                missing.append(field)
+
+        if self.header is not None:
+            print(f"🔀 {self.category} table header changed, column map rebuilt")
+        if missing:
+            print(f"⚠️ {self.category} columns not in the table header: {', '.join(missing)}")
+        self.header = header
+        self.positions = positions
+        self.rebuilds += 1
+
+    def values(self, record):
+        """Return {field: cell text} for a row record"""
+        cells = record['cells']
+        cell_positions = record.get('positions')
+        if self.positions is None or cell_positions is None:
+            return {field: cells[index] for field, (_, index) in self.columns.items() if index < len(cells)}
+        by_position = dict(zip(cell_positions, cells))
+        return {field: by_position.get(position) for field, position in self.positions.items()}
@@ -0,0 +1,133 @@
+"""
+Incremental (delta) scraping support for the LCSC scrapers.
+
+Each listing page gets a cheap signature: its row count plus the first and
+last LCSC part numbers on it. With --incremental the signatures of the last
+run are kept in Outputs/State/<name>.pages.json next to the parts each page
+produced:
+
+    {"1": {"signature": "25:C2906982:C2907133", "parts": ["C2906982", ...]}}
+
+A page whose signature still matches reuses the products from the previous
+snapshot (the Outputs/JSONs/<name>.json export, in any --json-format)
+without parsing. Only new or changed Supplier Part Numbers are reported by
+changed_parts(), so later stages can limit per-part work (such as detail
+page fetches) to them. Detail fields are not part of the listing, so they
+are ignored when comparing and carried over from the snapshot for parts
+whose listing data did not change.
+"""
+import json
+import os
+import re
+
+from lcsc_detail import DETAIL_FIELDS
+from lcsc_rows import product_link, product_table_fragment
+from lcsc_stream import iter_products
+
+_PRODUCT_ROW_RE = re.compile(r'<tr\b[^>]*\bid="[^"]*productId', re.IGNORECASE)
+_PART_LINK_RE = re.compile(r'product-detail/[^"\'<>]*?(C\d+)\.html')
+
+
+def part_key(product):
+    """Identify a product by its Supplier Part Number (MPN as fallback)"""
+    return product.get('Supplier Part Number') or product.get('Manufacturer Part Number')
+
+
+def page_signature(html=None, records=None):
+    """Return 'rows:first_part:last_part' for a page's HTML or row records"""
+    if records is not None:
+        parts = [_PART_LINK_RE.search(record.get('lcsc_href') or '') for record in records]
+        parts = [match.group(1) for match in parts if match]
+        count = len(records)
+    else:
+        table = product_table_fragment(html)
+        parts = _PART_LINK_RE.findall(table)
+        count = len(_PRODUCT_ROW_RE.findall(table))
+    first = parts[0] if parts else ''
+    last = parts[-1] if parts else ''
+    return f'{count}:{first}:{last}'
+
+
+def _listing_fields(product):
+    return {key: value for key, value in product.items() if key not in DETAIL_FIELDS}
+
+
+class DeltaTracker:
+    """Compare listing pages against the previous run's snapshot"""
+
+    def __init__(self, snapshot_path, state_path):
+        self.state_path = state_path
+        self.snapshot = {}
+        self.pages = {}
+        if os.path.exists(snapshot_path):
+            for product in iter_products(snapshot_path):
+                # Snapshots written before the Link fix hold double-prefixed urls
+                if product.get('Link'):
+                    product['Link'] = product_link(product['Link'])
+                self.snapshot[part_key(product)] = product
+        if os.path.exists(state_path):
+            with open(state_path, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f)
+        self.new_pages = {}
+        self.seen = set()
+        self.added = []
+        self.changed = []
+        self.skipped_pages = 0
+        self.parsed_pages = 0
+        print(f"📂 Incremental mode: {len(self.snapshot)} parts in snapshot, "
+              f"{len(self.pages)} page signatures from the last run")
+
+    def unchanged_products(self, page, signature):
+        """Return the snapshot products of an unchanged page, or None to parse it"""
+        previous = self.pages.get(str(page))
+        if not previous or previous['signature'] != signature:
+            return None
+        if any(key not in self.snapshot for key in previous['parts']):
+            return None
+        self.new_pages[str(page)] = previous
+        self.seen.update(previous['parts'])
+        self.skipped_pages += 1
+        return [self.snapshot[key] for key in previous['parts']]
+
+    def record_page(self, page, signature, products):
+        """Remember a parsed page and note its new or changed parts"""
+        keys = [part_key(product) for product in products]
+        self.new_pages[str(page)] = {'signature': signature, 'parts': keys}
+        self.parsed_pages += 1
+        for key, product in zip(keys, products):
+            if key in self.seen:
+                continue
+            self.seen.add(key)
+            previous = self.snapshot.get(key)
+            if previous is None:
+                self.added.append(key)
+            elif _listing_fields(previous) != _listing_fields(product):
+                self.changed.append(key)
+            else:
+                for field in DETAIL_FIELDS:
+                    if field in previous and field not in product:
+                        product[field] = previous[field]
+
+    def changed_parts(self):
+        """Supplier Part Numbers that are new or changed since the snapshot"""
+        return self.added + self.changed
+
+    def unseen_products(self):
+        """Snapshot products on no page of this run (kept when only part of the listing was crawled)"""
+        return [product for key, product in self.snapshot.items() if key not in self.seen]
+
+    def save(self):
+        """Write this run's page signatures for the next incremental run"""
+        folder = os.path.dirname(self.state_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.new_pages, f)
+        os.replace(temp_path, self.state_path)
+
+    def print_summary(self):
+        """Print how much of the listing was reused"""
+        removed = len(set(self.snapshot) - self.seen)
+        print(f"🔁 Incremental: {self.skipped_pages} pages unchanged, {self.parsed_pages} parsed | "
+              f"{len(self.added)} new, {len(self.changed)} changed, {removed} no longer listed")
@@ -0,0 +1,183 @@
+"""
+Product-detail enrichment for the LCSC scrapers.
+
+The listing only shows a few columns. DetailEnricher fetches the
+product-detail page behind every product's Link concurrently (a bounded
+thread pool over one pooled keep-alive HTTP session with retries) and
+merges the extra fields into the product dicts before export:
+
+    'Stock'         units in stock (int)
+    'Price Breaks'  [{'Quantity': 10, 'Unit Price': 0.0012}, ...]
+    'Datasheet'     datasheet url
+    'Attributes'    full attribute table {name: value}
+
+Parsed details are cached in the page cache (kind 'detail') so re-runs and
+incremental refreshes only fetch parts that are new, changed or expired.
+"""
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from bs4 import BeautifulSoup
+
+from lcsc_http import LCSCHttpBackend
+from lcsc_rows import product_link
+
+DETAIL_FIELDS = ('Stock', 'Price Breaks', 'Datasheet', 'Attributes')
+
+_STOCK_RE = re.compile(r'In[\s-]*Stock\s*:?\s*([\d,]+)', re.IGNORECASE)
+_COUNT_RE = re.compile(r'[\d,]+')
+_QUANTITY_RE = re.compile(r'^([\d,]+)\s*\+$')
+_PRICE_RE = re.compile(r'([\d,]*\.?\d+)')
+
+
+def _text(element):
+    return ' '.join(element.get_text(' ', strip=True).split())
+
+
+def _number(text):
+    return float(text.replace(',', ''))
+
+
+def _json_ld_product(soup):
+    """Return the schema.org Product object of the page, if any"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get('@type') == 'Product':
+                return item
+    return None
+
+
+def parse_detail_page(html):
+    """Extract stock, price breaks, datasheet and attributes from a product-detail page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    details = {}
+
+    # Two-cell rows are either price breaks ('10+', '$0.0012') or attributes ('Resistance', '10kΩ')
+    price_breaks = []
+    attributes = {}
+    for row in soup.find_all('tr'):
+        cells = row.find_all(['th', 'td'], recursive=False)
+        if len(cells) < 2:
+            continue
+        name, value = _text(cells[0]), _text(cells[1])
+        quantity = _QUANTITY_RE.match(name)
+        price = _PRICE_RE.search(value)
+        if quantity and price:
+            price_breaks.append({'Quantity': int(_number(quantity.group(1))),
+                                 'Unit Price': _number(price.group(1))})
+        elif name and value and len(cells) == 2 and name not in attributes:
+            attributes[name] = value
+
+    product = _json_ld_product(soup)
+    if product and not price_breaks:
+        offers = product.get('offers') or []
+        for offer in offers if isinstance(offers, list) else [offers]:
+            if offer.get('price') is not None:
+                quantity = (offer.get('eligibleQuantity') or {}).get('minValue', 1)
+                price_breaks.append({'Quantity': int(quantity), 'Unit Price': float(offer['price'])})
+
+    if price_breaks:
+        details['Price Breaks'] = sorted(price_breaks, key=lambda item: item['Quantity'])
+
+    # A 'Stock' attribute row, else an 'In Stock: 12,345' text anywhere on the page
+    stock = attributes.pop('Stock', None) or attributes.pop('In Stock', None)
+    match = _COUNT_RE.search(stock) if stock else _STOCK_RE.search(soup.get_text(' ', strip=True))
+    if match:
+        details['Stock'] = int(_number(match.group(match.lastindex or 0)))
+
+    datasheet = soup.select_one('a[href$=".pdf"], a[href*="datasheet"]')
+    if datasheet:
+        details['Datasheet'] = product_link(datasheet['href'])
+
+    if attributes:
+        details['Attributes'] = attributes
+    return details
+
+
+class DetailEnricher:
+    """Fetch product-detail pages concurrently and merge their fields into products"""
+
+    def __init__(self, workers=8, min_interval=0.25, cache=None, offline=False, backend=None):
+        self.workers = workers
+        self.cache = cache
+        self.offline = offline
+        self.backend = backend
+        self.min_interval = min_interval
+        self.fetched = 0
+        self.cached = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def _backend(self):
+        with self._lock:
+            if self.backend is None:
+                self.backend = LCSCHttpBackend(pool_size=self.workers, min_interval=self.min_interval)
+            return self.backend
+
+    def details_for(self, link):
+        """Return the parsed details of one product page (cache first), or None on failure"""
+        if self.cache:
+            cached = self.cache.get(link, kind='detail')
+            if cached is not None:
+                with self._lock:
+                    self.cached += 1
+                return json.loads(cached)
+        if self.offline:
+            return None
+
+        html = self._backend().fetch(link)
+        if html is None:
+            with self._lock:
+                self.failed += 1
+            return None
+        details = parse_detail_page(html)
+        if self.cache:
+            self.cache.put(link, json.dumps(details, ensure_ascii=False), kind='detail')
+        with self._lock:
+            self.fetched += 1
+        return details
+
+    def enrich(self, products, only=None):
+        """Merge detail fields into products in place.
+
+        Products that already carry details are skipped unless their
+        Supplier Part Number is in `only` (e.g. new or changed parts of an
+        incremental run). Returns the number of enriched products.
+        """
+        only = set(only or ())
+        todo = [product for product in products
+                if product.get('Link') and (product.get('Supplier Part Number') in only
+                                            or not any(field in product for field in DETAIL_FIELDS))]
+        if not todo:
+            print("🔎 Product details are up to date")
+            return 0
+
+        print(f"\n🔎 Enriching {len(todo)} products from their detail pages ({self.workers} workers)")
+        started = time.perf_counter()
+        enriched = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.details_for, product_link(product['Link'])): product
+                       for product in todo}
+            for done, future in enumerate(as_completed(futures), 1):
+                details = future.result()
+                if details:
+                    futures[future].update(details)
+                    enriched += 1
+                if done % 100 == 0:
+                    print(f"   {done}/{len(todo)} detail pages done")
+
+        print(f"✓ Enriched {enriched}/{len(todo)} products in {time.perf_counter() - started:.1f}s "
+              f"({self.fetched} fetched, {self.cached} from cache, {self.failed} failed)")
+        return enriched
+
+    def close(self):
+        """Close the pooled session"""
+        if self.backend:
+            self.backend.close()
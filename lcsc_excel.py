@@ -0,0 +1,217 @@
+"""
+Write-only Excel export for the LCSC scrapers.
+
+ExcelWorkbook streams rows into an openpyxl write-only workbook: every
+appended row goes straight to the sheet's temporary XML file (strings are
+written inline), so memory stays flat however many products a sheet has.
+Column widths (longest value + 2, at most 50) are tracked by ColumnWidths
+while the products go by instead of walking every cell afterwards.
+openpyxl writes a sheet's widths before its rows, so a sheet is added with
+its widths already known:
+
+    widths = ColumnWidths(fields)
+    widths.write(products)                  # or as a ProductStream writer
+    workbook = ExcelWorkbook('Outputs/Excels/FOJAN.xlsx')
+    workbook.add_sheet('Resistors', fields, product_rows(products, fields), widths)
+    workbook.save()
+
+A stream does not know up front which other keys (price breaks, attributes)
+its products carry, so ColumnWidths(fields, extra_keys=True) appends them
+to its fields as they first appear.
+
+A workbook holds any number of sheets; the scheduler's --workbook option
+writes one sheet per category. ExcelWriter is the one-sheet variant with
+the lcsc_stream writer interface. save() goes through a '.part' file and
+keeps the existing workbook (and its mtime) when the rows did not change:
+xlsx files embed their save time, so the comparison uses a digest of the
+rows stored in the workbook properties.
+"""
+import csv
+import hashlib
+import json
+import os
+import re
+import zipfile
+from collections.abc import Mapping
+
+from product_records import json_default
+
+
+def _source_key(field):
+    # The 'Description' column comes from the 'description' key
+    return 'description' if field == 'Description' else field
+
+
+def cell_value(value):
+    """Excel cell value of a product field (tables as JSON, empty strings as empty cells)"""
+    if isinstance(value, (list, Mapping)):
+        return json.dumps(value, ensure_ascii=False, default=json_default)
+    return None if value == '' else value
+
+
+def product_rows(products, fields):
+    """Yield the Excel rows of products in column order"""
+    keys = [_source_key(field) for field in fields]
+    for product in products:
+        yield [cell_value(product.get(key)) for key in keys]
+
+
+def csv_rows(csv_file):
+    """Yield the data rows of a CSV export (empty values as empty cells)"""
+    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            yield [value or None for value in row]
+
+
+class ColumnWidths:
+    """Excel column widths tracked while products are written (a ProductStream writer)"""
+
+    def __init__(self, fields, extra_keys=False):
+        self.fields = list(fields)
+        self.longest = {field: len(field) for field in self.fields}
+        self.extra_keys = extra_keys
+        self.known = {_source_key(field) for field in self.fields}
+
+    def write(self, products):
+        if self.extra_keys:
+            self.add_keys(products)
+        for row in product_rows(products, self.fields):
+            self.add(row)
+
+    def add_keys(self, products):
+        """Add product keys that are not columns yet, in the order they first appear"""
+        for product in products:
+            for key in product:
+                if key not in self.known:
+                    self.known.add(key)
+                    self.fields.append(key)
+                    self.longest[key] = len(key)
+
+    def add(self, row):
+        """Account for one row of cell values in column order"""
+        longest = self.longest
+        for field, value in zip(self.fields, row):
+            if value is not None:
+                length = len(value) if type(value) is str else len(str(value))
+                if length > longest[field]:
+                    longest[field] = length
+
+    def width(self, field):
+        """Width of a column (fields never written get their header width)"""
+        return min(self.longest.get(field, len(field)) + 2, 50)
+
+    def close(self, commit=True):
+        return True
+
+
+def _saved_digest(path):
+    # Content digest stored by ExcelWorkbook.save (None for other or missing files)
+    try:
+        with zipfile.ZipFile(path) as archive:
+            core = archive.read('docProps/core.xml').decode('utf-8')
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+    match = re.search(r'<dc:identifier[^>]*>([0-9a-f]{64})</dc:identifier>', core)
+    return match.group(1) if match else None
+
+
+class ExcelWorkbook:
+    """openpyxl write-only workbook, one streamed sheet per add_sheet()"""
+
+    def __init__(self, path):
+        # ImportError tells the caller to install openpyxl
+        from openpyxl import Workbook
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.counts = {}
+        # xlsx files embed save times, so unchanged content is recognized by this digest
+        self.digest = hashlib.sha256()
+
+    def open_sheet(self, title, fields, widths):
+        """Start a sheet with its column widths and header row; returns it for append()"""
+        from openpyxl.utils import get_column_letter
+        # Excel sheet names are limited to 31 characters
+        sheet = self.workbook.create_sheet(title[:31])
+        widths = [widths.width(field) for field in fields]
+        for col_num, width in enumerate(widths, 1):
+            sheet.column_dimensions[get_column_letter(col_num)].width = width
+        sheet.append(list(fields))
+        self.digest.update(repr((sheet.title, widths, list(fields))).encode('utf-8'))
+        self.counts[sheet.title] = 0
+        return sheet
+
+    def append(self, sheet, row):
+        """Append one row of cell values to a sheet"""
+        sheet.append(row)
+        self.digest.update(repr(row).encode('utf-8'))
+        self.counts[sheet.title] += 1
+
+    def add_sheet(self, title, fields, rows, widths):
+        """Write a header and rows to a new sheet; returns the number of rows"""
+        sheet = self.open_sheet(title, fields, widths)
+        for row in rows:
+            self.append(sheet, row)
+        return self.counts[sheet.title]
+
+    def add_csv_sheet(self, title, csv_file, widths=None):
+        """Write a CSV export to a new sheet; returns the number of rows"""
+        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+            fields = next(csv.reader(f))
+        if widths is None:
+            # Not tracked while the CSV was written: size the columns from it first
+            widths = ColumnWidths(fields)
+            for row in csv_rows(csv_file):
+                widths.add(row)
+        return self.add_sheet(title, fields, csv_rows(csv_file), widths)
+
+    def save(self):
+        """Write the workbook through a part file; returns False if the saved one already matched"""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        digest = self.digest.hexdigest()
+        self.workbook.properties.identifier = digest
+        part_path = self.path + '.part'
+        try:
+            self.workbook.save(part_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        if _saved_digest(self.path) == digest:
+            os.remove(part_path)
+            return False
+        os.replace(part_path, self.path)
+        return True
+
+
+class ExcelWriter:
+    """Stream products into a one-sheet workbook (same interface as the lcsc_stream writers)"""
+
+    label = 'Excel'
+
+    def __init__(self, path, title, fields, widths):
+        self.path = path
+        self.fields = fields
+        self.workbook = ExcelWorkbook(path)
+        self.sheet = self.workbook.open_sheet(title, fields, widths)
+        self.count = 0
+        self.changed = None
+
+    def write(self, products):
+        for row in product_rows(products, self.fields):
+            self.workbook.append(self.sheet, row)
+        self.count += len(products)
+
+    def close(self, commit=True):
+        """Save the workbook (nothing is written without commit); returns True on success"""
+        if not commit:
+            return False
+        try:
+            self.changed = self.workbook.save()
+            return True
+        except Exception as e:
+            print(f"✗ Error saving Excel: {e}")
+            return False
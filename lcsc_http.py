@@ -0,0 +1,161 @@
+"""
+Direct HTTP fetch backend for the LCSC scrapers.
+
+Fetches category listing pages over a pooled, keep-alive requests session
+instead of rendering them in Chrome. The scrapers parse the returned HTML
+with their usual extract_products / parse_product_row methods, so both
+backends produce exactly the same product dicts.
+
+Run this file directly to serve recorded pages from a folder (page-1.html,
+page-2.html, ...) as a local stub of the LCSC listing:
+
+    python lcsc_http.py serve recorded_pages 8765
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+def build_page_url(url, page):
+    """Return the listing url addressed directly at the given page number"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != 'page']
+    if page and page > 1:
+        query.append(('page', str(page)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def parse_total_pages(soup):
+    """Read the total page count from the listing pagination (None if missing)"""
+    numbers = []
+    for item in soup.select('.v-pagination__item'):
+        text = item.get_text(strip=True)
+        if text.isdigit():
+            numbers.append(int(text))
+    return max(numbers) if numbers else None
+
+
+class RateLimiter:
+    """Thread-safe minimum spacing between requests"""
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until the next request slot is free"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LCSCHttpBackend:
+    """Fetch listing pages over a pooled requests session"""
+
+    def __init__(self, pool_size=8, timeout=20, retries=3, min_interval=1.0,
+                 headers=None, record_folder=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(min_interval)
+        self.record_folder = record_folder
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        if self.record_folder:
+            os.makedirs(self.record_folder, exist_ok=True)
+
+    def fetch(self, url):
+        """GET a url and return its text (None on failure)"""
+        self.rate_limiter.wait()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"❌ HTTP fetch failed for {url}: {e}")
+            return None
+        response.encoding = response.encoding or 'utf-8'
+        return response.text
+
+    def fetch_response(self, url):
+        """GET a url without pacing and return (status, text); (None, None) on network errors"""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except Exception:
+            return None, None
+        response.encoding = response.encoding or 'utf-8'
+        return response.status_code, response.text
+
+    def fetch_page(self, url, page):
+        """Fetch one listing page by number"""
+        html = self.fetch(build_page_url(url, page))
+        if html is not None and self.record_folder:
+            path = os.path.join(self.record_folder, f'page-{page}.html')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(html)
+        return html
+
+    def close(self):
+        """Close the pooled session"""
+        self.session.close()
+
+
+def serve_recorded(folder, port=8765):
+    """Serve page-N.html files from folder for any path with ?page=N"""
+
+    class RecordedPageHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = dict(parse_qsl(urlsplit(self.path).query))
+            page = query.get('page', '1')
+            path = os.path.join(folder, f'page-{page}.html')
+            if not page.isdigit() or not os.path.exists(path):
+                self.send_error(404)
+                return
+            with open(path, 'rb') as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), RecordedPageHandler)
+    print(f"Serving recorded pages from {folder} on http://127.0.0.1:{port}/")
+    return server
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == 'serve':
+        port = int(sys.argv[3]) if len(sys.argv) > 3 else 8765
+        serve_recorded(sys.argv[2], port).serve_forever()
+    else:
+        print("Usage: python lcsc_http.py serve <folder> [port]")
@@ -0,0 +1,114 @@
+"""
+Persistent cross-run, cross-category part index for the LCSC scrapers.
+
+The scraper only deduplicates within one process. With --dedup-index every
+exported part is also recorded in Outputs/State/parts.sqlite under both its
+Supplier Part Number and its Manufacturer Part Number, together with the
+export that owns it (e.g. 'Resistors-FOJAN'):
+
+    parts(key TEXT PRIMARY KEY, owner TEXT, seen REAL)
+    ('S:C2906982', 'Resistors-FOJAN', 1718000000.0)
+    ('M:FRC0603F1002TS', 'Resistors-FOJAN', 1718000000.0)
+
+Rows whose part is already owned by another export (the same part listed
+under a second category or brand) are skipped before parse_row_record
+runs. An export keeps parsing its own parts, so every run still writes a
+complete snapshot. Owners that have not seen a part for max_age days give
+it up, so a part that moved to another listing is picked up there.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+
+def part_keys(supplier_number, manufacturer_number):
+    """Index keys of a part (missing numbers are left out)"""
+    keys = []
+    if supplier_number:
+        keys.append(f'S:{supplier_number}')
+    if manufacturer_number:
+        keys.append(f'M:{manufacturer_number}')
+    return keys
+
+
+class PartIndex:
+    """SQLite-backed set of known parts and the export owning each of them"""
+
+    def __init__(self, path, owner, max_age=30):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.owner = owner
+        self.max_age = max_age * 86400 if max_age else None
+        self.skipped = 0
+        self.claimed = 0
+        self._lock = threading.Lock()
+        # The scheduler runs several jobs (one index each) against the same file
+        self.db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS parts '
+                        '(key TEXT PRIMARY KEY, owner TEXT NOT NULL, seen REAL NOT NULL) WITHOUT ROWID')
+        self.db.commit()
+
+    def part_count(self):
+        """Number of indexed parts"""
+        with self._lock:
+            # Parts are counted by their Supplier Part Number keys
+            return self.db.execute("SELECT COUNT(*) FROM parts WHERE key >= 'S:' AND key < 'S;'").fetchone()[0]
+
+    def foreign_keys(self, keys):
+        """Return the keys among `keys` that another export owns"""
+        keys = list(keys)
+        if not keys:
+            return set()
+        oldest = time.time() - self.max_age if self.max_age else 0
+        found = set()
+        with self._lock:
+            # One query per chunk instead of one per row (SQLite limits host parameters)
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                found.update(row[0] for row in self.db.execute(
+                    f"SELECT key FROM parts WHERE key IN ({','.join('?' * len(chunk))}) "
+                    "AND owner != ? AND seen >= ?", (*chunk, self.owner, oldest)))
+        return found
+
+    def filter_records(self, records):
+        """Drop row records whose part another export already owns (before they are parsed)"""
+        records = list(records)
+        foreign = self.foreign_keys(key for record in records
+                                    for key in part_keys(record['lcsc_number'], record['part_number']))
+        if not foreign:
+            return records
+        kept = [record for record in records
+                if not foreign.intersection(part_keys(record['lcsc_number'], record['part_number']))]
+        self.skipped += len(records) - len(kept)
+        return kept
+
+    def claim(self, products):
+        """Record products as owned by this export (parts owned elsewhere keep their owner)"""
+        now = time.time()
+        oldest = now - self.max_age if self.max_age else 0
+        rows = [(key, self.owner, now, oldest)
+                for product in products
+                for key in part_keys(product.get('Supplier Part Number'), product.get('Manufacturer Part Number'))]
+        if not rows:
+            return
+        with self._lock:
+            # Take over parts whose owner stopped listing them, refresh our own
+            self.db.executemany('INSERT INTO parts (key, owner, seen) VALUES (?1, ?2, ?3) '
+                                'ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, seen = excluded.seen '
+                                'WHERE parts.owner = excluded.owner OR parts.seen < ?4', rows)
+            self.db.commit()
+        self.claimed += len(products)
+
+    def print_summary(self):
+        """Print how many rows the index saved and how big it is"""
+        print(f"🧮 Part index: {self.skipped} rows skipped (owned by other exports), "
+              f"{self.claimed} parts claimed by {self.owner}, {self.part_count()} parts indexed")
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self.db.close()
@@ -0,0 +1,171 @@
+"""
+Typed columnar (Parquet) export for the LCSC scrapers.
+
+With --parquet every crawl also writes Outputs/Parquets/<name>.parquet.
+It holds the export columns as strings (null when a product has no such
+field, 'Stock' from --enrich as an integer) plus float columns parsed with component_values, so tools can
+filter and sort on real numbers instead of strings like '4.7kΩ':
+
+    resistance_ohms  capacitance_farads  voltage_volts  power_watts  tolerance_fraction
+
+Rows are buffered and written one row group at a time while the crawl
+streams, into a '.part' file that replaces the real export on commit.
+Reading the whole category back is a column read:
+
+    table = read_table('Outputs/Parquets/Resistors-FOJAN.parquet', package='0603', tolerance=1)
+    for product in iter_products('Outputs/Parquets/Resistors-FOJAN.parquet'):
+        ...
+
+Needs pyarrow (pip install pyarrow), the scrapers skip the export without it.
+"""
+import os
+
+from component_values import parse_value
+from lcsc_stream import commit_file
+from product_records import Product
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Source field, typed column and unit (tolerance is stored as a fraction, 1% -> 0.01)
+TYPED_COLUMNS = (
+    ('Resistance', 'resistance_ohms', 'Ω'),
+    ('Capacitance', 'capacitance_farads', 'F'),
+    ('Voltage Rating', 'voltage_volts', 'V'),
+    ('Power', 'power_watts', 'W'),
+    ('Tolerance', 'tolerance_fraction', '%'),
+)
+
+# Export fields stored as integers, every other export field is a string column
+INTEGER_FIELDS = ('Stock',)
+
+# Typed column holding the main value of a category (see lcsc_catalog.VALUE_FIELDS)
+VALUE_COLUMNS = ('resistance_ohms', 'capacitance_farads')
+
+
+def _source_key(field):
+    # The CSV 'Description' column comes from the 'description' key
+    return 'description' if field == 'Description' else field
+
+
+def typed_value(product, field, unit):
+    """Parse a product field to a float in SI units (fractions for tolerances)"""
+    value = parse_value(product.get(field), unit)
+    if value is not None and unit == '%':
+        value /= 100
+    return value
+
+
+def column_value(value, integer=False):
+    """Value of an export field in its Parquet column (int for INTEGER_FIELDS, else str)"""
+    if value is None:
+        return None
+    if integer:
+        # Stock read back from a CSV export is a string like '12,345'
+        return int(str(value).replace(',', '')) if value != '' else None
+    return value if isinstance(value, str) else str(value)
+
+
+def parquet_schema(fields):
+    """String (or integer) columns for the export fields plus float columns for the typed fields among them"""
+    columns = [pa.field(field, pa.int64() if field in INTEGER_FIELDS else pa.string()) for field in fields]
+    columns += [pa.field(column, pa.float64()) for field, column, _ in TYPED_COLUMNS if field in fields]
+    return pa.schema(columns)
+
+
+class ParquetWriter:
+    """Write products to a Parquet file in row groups (same interface as the lcsc_stream writers)"""
+
+    label = 'Parquet'
+
+    def __init__(self, path, fields, row_group_size=10000):
+        self.path = path
+        self.part_path = path + '.part'
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.fields = fields
+        self.integer = [field in INTEGER_FIELDS for field in fields]
+        self.typed = [(field, column, unit) for field, column, unit in TYPED_COLUMNS if field in fields]
+        self.schema = parquet_schema(fields)
+        self.row_group_size = row_group_size
+        self.writer = pq.ParquetWriter(self.part_path, self.schema, compression='zstd')
+        self.columns = {name: [] for name in self.schema.names}
+        self.pending = 0
+        self.count = 0
+        self.changed = None
+
+    def write(self, products):
+        for product in products:
+            for field, integer in zip(self.fields, self.integer):
+                self.columns[field].append(column_value(product.get(_source_key(field)), integer))
+            for field, column, unit in self.typed:
+                self.columns[column].append(typed_value(product, field, unit))
+        self.pending += len(products)
+        self.count += len(products)
+        if self.pending >= self.row_group_size:
+            self.write_row_group()
+
+    def write_row_group(self):
+        """Write the buffered rows as one row group"""
+        if not self.pending:
+            return
+        self.writer.write_table(pa.table(self.columns, schema=self.schema))
+        for values in self.columns.values():
+            values.clear()
+        self.pending = 0
+
+    def close(self, commit=True):
+        """Commit the finished file, or drop the partial one; returns True on success"""
+        try:
+            if commit:
+                self.write_row_group()
+            self.writer.close()
+            if commit:
+                self.changed = commit_file(self.part_path, self.path)
+                return True
+        except (OSError, pa.ArrowException) as e:
+            print(f"✗ Error writing {self.path}: {e}")
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+        return False
+
+
+def read_table(path, columns=None, package=None, tolerance=None,
+               min_value=None, max_value=None, min_voltage=None):
+    """Read a Parquet export as a pyarrow Table, filtered like lcsc_catalog.Catalog.products.
+
+    package may be one package or a list of them; tolerance is in percent
+    and the values are SI (ohms, farads, volts).
+    """
+    names = pq.read_schema(path).names
+    value_column = next((column for column in VALUE_COLUMNS if column in names), None)
+    filters = []
+    if package is not None:
+        filters.append(('Package', 'in', [package] if isinstance(package, str) else list(package)))
+    if tolerance is not None:
+        filters.append(('tolerance_fraction', '==', float(tolerance) / 100))
+    for column, operator, limit in ((value_column, '>=', min_value), (value_column, '<=', max_value),
+                                    ('voltage_volts', '>=', min_voltage)):
+        if limit is not None:
+            filters.append((column, operator, float(limit)))
+    return pq.read_table(path, columns=columns, filters=filters or None)
+
+
+def iter_products(path, batch_size=1024, **filters):
+    """Yield a Parquet export's Products one record batch at a time (fields the product did not have are left out)"""
+    typed = {column for _, column, _ in TYPED_COLUMNS}
+    fields = [name for name in pq.read_schema(path).names if name not in typed]
+    keys = [_source_key(field) for field in fields]
+    if any(value is not None for value in filters.values()):
+        batches = read_table(path, columns=fields, **filters).to_batches(batch_size)
+    else:
+        batches = pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=fields)
+    for batch in batches:
+        columns = batch.to_pydict()
+        for row in zip(*(columns[field] for field in fields)):
+            yield Product([(key, value) for key, value in zip(keys, row) if value is not None])
@@ -0,0 +1,308 @@
+"""
+Product row records for the LCSC listing table.
+
+A row record is a plain dict holding just what parse_row_record needs:
+
+    {
+        'id': 'productId...',
+        'other_suppliers': False,
+        'part_number': 'FRC0603F1002TS',        # a[href*="product-detail"][title]
+        'lcsc_number': 'C2906982',              # a.font-Bold-600.major--text[...]
+        'lcsc_href': '/product-detail/C2906982.html',
+        'description': '10kΩ ±1% 100mW 0603 ...', # div[title].ellipsis-6 title
+        'cells': ['...', ...],                  # td.major2--text.py10 texts
+        'positions': [3, 4, ...],               # column index of each cell in the row
+    }
+
+Records can be built from BeautifulSoup rows, with the lxml fast path
+(html_to_records) or directly inside the browser with EXTRACT_ROWS_SCRIPT,
+which skips page_source serialization and Python-side HTML parsing. Texts
+follow BeautifulSoup's get_text(strip=True): every text node stripped,
+empty ones dropped, joined without separator.
+
+The table header is read separately (table_header / HEADER_SCRIPT) so the
+cell positions can be mapped to column names (see lcsc_columns).
+
+Check that the lxml path matches BeautifulSoup on saved pages with:
+
+    python lcsc_rows.py compare page-1.html page-2.html ...
+
+Without pages it checks the listing pages in fixtures/, and that every
+'<name>-shuffled.html' page (same table, columns reordered) gives the same
+values per header column as '<name>.html'.
+"""
+import glob
+import html as html_lib
+import os
+import re
+import sys
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    etree = None
+
+LCSC_BASE_URL = 'https://www.lcsc.com'
+
+PRODUCT_ROW_SELECTOR = 'tr[id*="productId"]'
+PART_NUMBER_SELECTOR = 'a[href*="product-detail"][title]'
+LCSC_NUMBER_SELECTOR = 'a.font-Bold-600.major--text[href*="product-detail"]'
+DESCRIPTION_SELECTOR = 'div[title].ellipsis-6'
+CELL_CLASS = 'major2--text py10'
+
+EXTRACT_ROWS_SCRIPT = """
+const strippedText = (el) => {
+    const parts = [];
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        const parent = node.parentNode.nodeName;
+        if (parent === 'SCRIPT' || parent === 'STYLE' || parent === 'TEMPLATE') continue;
+        const text = node.nodeValue.trim();
+        if (text) parts.push(text);
+    }
+    return parts.join('');
+};
+const rows = Array.from(document.querySelectorAll('%(row)s'));
+return rows.map((row) => {
+    const part = row.querySelector('%(part)s');
+    const lcsc = row.querySelector('%(lcsc)s');
+    const desc = row.querySelector('%(desc)s');
+    const cells = [];
+    const positions = [];
+    row.querySelectorAll('td').forEach((td, index) => {
+        if ((td.getAttribute('class') || '').trim().split(/\\s+/).join(' ') === '%(cell)s') {
+            cells.push(td);
+            positions.push(index);
+        }
+    });
+    return {
+        id: row.id,
+        other_suppliers: row.textContent.includes('Other Suppliers'),
+        part_number: part ? strippedText(part) : null,
+        lcsc_number: lcsc ? strippedText(lcsc) : null,
+        lcsc_href: lcsc ? lcsc.getAttribute('href') : null,
+        description: desc ? desc.getAttribute('title') : null,
+        cells: cells.map(strippedText),
+        positions: positions,
+    };
+});
+""" % {
+    'row': PRODUCT_ROW_SELECTOR,
+    'part': PART_NUMBER_SELECTOR,
+    'lcsc': LCSC_NUMBER_SELECTOR,
+    'desc': DESCRIPTION_SELECTOR,
+    'cell': CELL_CLASS,
+}
+
+HEADER_SCRIPT = """
+const row = document.querySelector('%(row)s');
+const table = row ? row.closest('table') : null;
+if (!table) return null;
+const cells = Array.from(table.querySelectorAll('th'));
+const names = [];
+cells.forEach((th) => {
+    const span = parseInt(th.getAttribute('colspan') || '1', 10) || 1;
+    const name = th.textContent.replace(/\\s+/g, ' ').trim();
+    for (let i = 0; i < span; i++) names.push(name);
+});
+return names;
+""" % {'row': PRODUCT_ROW_SELECTOR}
+
+
+if etree is not None:
+    FAST_PARSER_AVAILABLE = True
+    _HTML_PARSER = etree.HTMLParser(remove_comments=True, remove_pis=True)
+    _ROWS = etree.XPath('//tr[contains(@id, "productId")]')
+    # Same exact class string match as BeautifulSoup's find_all('td', class_=CELL_CLASS)
+    _CELLS = etree.XPath('.//td[normalize-space(@class) = $cell_class]')
+    _ALL_CELLS = etree.XPath('.//td')
+    # Text nodes as BeautifulSoup's get_text() sees them (no style, script or template content)
+    _TEXTS = etree.XPath('.//text()[not(ancestor::style or ancestor::script or ancestor::template)]')
+    _PART_NUMBER = CSSSelector(PART_NUMBER_SELECTOR, translator='html')
+    _LCSC_NUMBER = CSSSelector(LCSC_NUMBER_SELECTOR, translator='html')
+    _DESCRIPTION = CSSSelector(DESCRIPTION_SELECTOR, translator='html')
+else:
+    FAST_PARSER_AVAILABLE = False
+
+_PRODUCT_ROW_RE = re.compile(r'<tr\b[^>]*\bid="[^"]*productId', re.IGNORECASE)
+_TABLE_TAG_RE = re.compile(r'<(/?)table\b', re.IGNORECASE)
+_HEADER_CELL_RE = re.compile(r'<th\b([^>]*)>(.*?)</th>', re.IGNORECASE | re.DOTALL)
+_COLSPAN_RE = re.compile(r'colspan\s*=\s*["\']?(\d+)', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]*>')
+
+
+def product_link(href):
+    """Absolute product-detail url for a row href.
+    
+    The listing already renders absolute hrefs, so blindly prefixing the
+    site produced 'https://www.lcsc.comhttps://...'; such links are repaired.
+    """
+    if not href:
+        return href
+    while href.startswith(LCSC_BASE_URL) and href[len(LCSC_BASE_URL):].startswith('http'):
+        href = href[len(LCSC_BASE_URL):]
+    return urljoin(LCSC_BASE_URL + '/', href)
+
+
+def soup_row_to_record(row):
+    """Build a row record from a BeautifulSoup <tr>"""
+    part_elem = row.select_one(PART_NUMBER_SELECTOR)
+    lcsc_elem = row.select_one(LCSC_NUMBER_SELECTOR)
+    desc_elem = row.select_one(DESCRIPTION_SELECTOR)
+    cells = row.find_all('td', class_=CELL_CLASS)
+    columns = {id(td): index for index, td in enumerate(row.find_all('td'))}
+    return {
+        'id': row.get('id'),
+        'other_suppliers': 'Other Suppliers' in row.get_text(),
+        'part_number': part_elem.get_text(strip=True) if part_elem else None,
+        'lcsc_number': lcsc_elem.get_text(strip=True) if lcsc_elem else None,
+        'lcsc_href': lcsc_elem['href'] if lcsc_elem else None,
+        'description': desc_elem['title'] if desc_elem else None,
+        'cells': [cell.get_text(strip=True) for cell in cells],
+        'positions': [columns[id(cell)] for cell in cells],
+    }
+
+
+def soup_table_header(soup):
+    """Return the column names of the product table in a BeautifulSoup page (None if missing)"""
+    row = soup.find('tr', id=lambda x: x and 'productId' in x)
+    table = row.find_parent('table') if row else None
+    if table is None:
+        return None
+    names = []
+    for th in table.find_all('th'):
+        span = int(th.get('colspan', 1)) if str(th.get('colspan', 1)).isdigit() else 1
+        names.extend([' '.join(th.get_text().split())] * max(span, 1))
+    return names or None
+
+
+def product_table_fragment(html):
+    """Return just the <table> holding the product rows (whole page if not found)"""
+    first_row = _PRODUCT_ROW_RE.search(html)
+    if not first_row:
+        return html
+    start = max(html.rfind('<table', 0, first_row.start()), html.rfind('<TABLE', 0, first_row.start()))
+    if start == -1:
+        return html
+    depth = 0
+    for match in _TABLE_TAG_RE.finditer(html, start):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            end = html.find('>', match.end()) + 1
+            fragment = html[start:end]
+            # A nested table closing before the rows means we picked the wrong one
+            return fragment if _PRODUCT_ROW_RE.search(fragment) else html
+    return html
+
+
+def table_header(html):
+    """Return the column names of the product table in a page's HTML (None if missing)"""
+    table = product_table_fragment(html)
+    names = []
+    for attributes, content in _HEADER_CELL_RE.findall(table):
+        span = _COLSPAN_RE.search(attributes)
+        name = ' '.join(html_lib.unescape(_TAG_RE.sub(' ', content)).split())
+        names.extend([name] * max(int(span.group(1)) if span else 1, 1))
+    return names or None
+
+
+def _stripped_text(element):
+    return ''.join(text.strip() for text in _TEXTS(element))
+
+
+def html_to_records(html):
+    """Build row records with lxml from the product table fragment only"""
+    root = etree.fromstring(product_table_fragment(html), _HTML_PARSER)
+    if root is None:
+        return []
+    records = []
+    for row in _ROWS(root):
+        part_elem = _PART_NUMBER(row)
+        lcsc_elem = _LCSC_NUMBER(row)
+        desc_elem = _DESCRIPTION(row)
+        cells = _CELLS(row, cell_class=CELL_CLASS)
+        columns = {td: index for index, td in enumerate(_ALL_CELLS(row))}
+        records.append({
+            'id': row.get('id'),
+            'other_suppliers': 'Other Suppliers' in ''.join(_TEXTS(row)),
+            'part_number': _stripped_text(part_elem[0]) if part_elem else None,
+            'lcsc_number': _stripped_text(lcsc_elem[0]) if lcsc_elem else None,
+            'lcsc_href': lcsc_elem[0].get('href') if lcsc_elem else None,
+            'description': desc_elem[0].get('title') if desc_elem else None,
+            'cells': [_stripped_text(cell) for cell in cells],
+            'positions': [columns[cell] for cell in cells],
+        })
+        # Free the row subtree as soon as its record is built
+        row.clear()
+    return records
+
+
+def page_to_records(html, parser='bs4'):
+    """Build row records from a page's HTML with 'bs4' or the 'lxml' fast path"""
+    if parser == 'lxml' and FAST_PARSER_AVAILABLE:
+        return html_to_records(html)
+    soup = BeautifulSoup(html, 'html.parser')
+    product_rows = soup.find_all('tr', id=lambda x: x and 'productId' in x)
+    return [soup_row_to_record(row) for row in product_rows]
+
+
+def page_to_table(html, parser='bs4'):
+    """Return (header, records) for a page's HTML"""
+    return table_header(html), page_to_records(html, parser)
+
+
+def compare_parsers(html):
+    """Return the indexes of rows where the lxml and BeautifulSoup records differ"""
+    soup_records = page_to_records(html, 'bs4')
+    fast_records = html_to_records(html)
+    if len(soup_records) != len(fast_records):
+        return list(range(max(len(soup_records), len(fast_records))))
+    return [i for i, (a, b) in enumerate(zip(soup_records, fast_records)) if a != b]
+
+
+def header_values(html, parser='bs4'):
+    """Return each row's {header name: cell text}, which does not depend on the column order"""
+    header, records = page_to_table(html, parser)
+    return [{header[position]: cell for position, cell in zip(record['positions'], record['cells'])}
+            for record in records]
+
+
+FIXTURE_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != 'compare':
+        print("Usage: python lcsc_rows.py compare [page.html ...]")
+        sys.exit(1)
+    if not FAST_PARSER_AVAILABLE:
+        print("✗ lxml and cssselect are required: pip install lxml cssselect")
+        sys.exit(1)
+    paths = sys.argv[2:] or sorted(glob.glob(os.path.join(FIXTURE_FOLDER, '*.html')))
+    failed = False
+    for path in paths:
+        mismatches = compare_parsers(_read(path))
+        status = "✓ identical" if not mismatches else f"✗ {len(mismatches)} rows differ"
+        print(f"{path}: {status}")
+        failed = failed or bool(mismatches)
+    
+    # Reordered columns have to give the same values per header column, with both parsers
+    for path in paths:
+        original = path.replace('-shuffled.html', '.html')
+        if original == path or not os.path.exists(original):
+            continue
+        same = all(header_values(_read(path), parser) == header_values(_read(original), parser)
+                   for parser in ('bs4', 'lxml'))
+        status = "✓ same values" if same else "✗ values differ"
+        print(f"{path} vs {os.path.basename(original)}: {status}")
+        failed = failed or not same
+    sys.exit(1 if failed else 0)
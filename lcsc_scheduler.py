@@ -0,0 +1,293 @@
+"""
+Multi-category, multi-brand crawl scheduler for the LCSC scrapers.
+
+Runs a list of (category, brand) jobs in one process. Jobs wait in a
+priority queue and share warm fetch resources: a pool of Chrome drivers
+that are reused from job to job, or one pooled HTTP session. A per-host
+limit caps how many jobs crawl the same host at the same time:
+
+    python lcsc_scheduler.py Resistors Capacitors:FOJAN:0 --backend http --parallel-jobs 2
+
+A job is CATEGORY[:BRAND[:PRIORITY]]. BRAND is a name from BRANDS or a
+numeric LCSC brand id (default FOJAN), and lower PRIORITY values run first
+(default 10). Every job exports to Outputs/ as <Category>-<Brand>.* just
+like the single-category scripts, and accepts the same crawl options.
+With --workbook the CSV exports of the successful jobs are also collected
+into one Excel workbook, one sheet per category:
+
+    python lcsc_scheduler.py Resistors Capacitors --backend http --workbook Outputs/Excels/FOJAN.xlsx
+"""
+import heapq
+import importlib.util
+import itertools
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from lcsc_excel import ExcelWorkbook
+from lcsc_http import LCSCHttpBackend
+from lcsc_scraper import LCSCScraper, build_arg_parser, check_environment, crawl_and_export
+
+# Category scrapers, loaded from the per-category scripts
+SCRAPER_SCRIPTS = {
+    'Resistors': 'Resistors Scrape [FOJAN].py',
+    'Capacitors': 'Capacitors Scrape [FOJAN].py',
+}
+
+_scraper_classes = {}
+_load_lock = threading.Lock()
+
+
+def scraper_class(category):
+    """Return the LCSCScraper subclass of a category (imported from its script)"""
+    with _load_lock:
+        if category not in _scraper_classes:
+            if category not in SCRAPER_SCRIPTS:
+                raise ValueError(f"unknown category {category!r}, choose from {', '.join(SCRAPER_SCRIPTS)}")
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)), SCRAPER_SCRIPTS[category])
+            spec = importlib.util.spec_from_file_location(f'lcsc_category_{category.lower()}', path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            for value in vars(module).values():
+                if isinstance(value, type) and issubclass(value, LCSCScraper) and value.CATEGORY == category:
+                    _scraper_classes[category] = value
+                    break
+            else:
+                raise ValueError(f"{SCRAPER_SCRIPTS[category]} defines no scraper for {category}")
+        return _scraper_classes[category]
+
+
+class CrawlJob:
+    """One (category, brand) listing crawl"""
+
+    def __init__(self, category, brand='FOJAN', priority=10):
+        self.category = category
+        self.brand = brand
+        self.priority = priority
+        self.url = scraper_class(category).category_url(brand)
+        self.host = urlsplit(self.url).netloc
+        self.seconds = None
+        self.ok = False
+        self.csv_file = None
+        self.widths = None
+
+    @classmethod
+    def parse(cls, text):
+        """Build a job from CATEGORY[:BRAND[:PRIORITY]]"""
+        parts = text.split(':')
+        category = parts[0]
+        brand = parts[1] if len(parts) > 1 and parts[1] else 'FOJAN'
+        priority = int(parts[2]) if len(parts) > 2 else 10
+        return cls(category, brand, priority)
+
+    def __str__(self):
+        return f'{self.category}-{self.brand}'
+
+
+class CrawlScheduler:
+    """Run crawl jobs by priority over shared drivers / HTTP sessions with per-host limits"""
+
+    def __init__(self, args, parallel_jobs=1, per_host=1, headless=True, workbook=None):
+        self.args = args
+        self.workbook = workbook
+        self.parallel_jobs = parallel_jobs
+        self.per_host = per_host
+        self.headless = headless
+        self.jobs = []
+        self.finished = []
+        self._queue = []
+        self._order = itertools.count()
+        self._running = {}
+        self._changed = threading.Condition()
+        self._idle_drivers = queue.Queue()
+        self._drivers = []
+        self.http = None
+        self.drivers_started = 0
+
+    def add(self, job):
+        """Queue a job"""
+        self.jobs.append(job)
+        heapq.heappush(self._queue, (job.priority, next(self._order), job))
+
+    def _next_job(self):
+        """Pop the highest priority job whose host has a free slot (None when the queue is empty)"""
+        with self._changed:
+            while self._queue:
+                for entry in sorted(self._queue):
+                    job = entry[2]
+                    if self._running.get(job.host, 0) < self.per_host:
+                        self._queue.remove(entry)
+                        heapq.heapify(self._queue)
+                        self._running[job.host] = self._running.get(job.host, 0) + 1
+                        return job
+                self._changed.wait()
+            return None
+
+    def _finish(self, job):
+        with self._changed:
+            self._running[job.host] -= 1
+            self.finished.append(job)
+            self._changed.notify_all()
+
+    def _acquire_driver(self, scraper):
+        """Reuse an idle warm driver, or start a new one"""
+        try:
+            return self._idle_drivers.get_nowait()
+        except queue.Empty:
+            driver = scraper.create_driver()
+            with self._changed:
+                self._drivers.append(driver)
+                self.drivers_started += 1
+            return driver
+
+    def _shared_http(self):
+        with self._changed:
+            if self.http is None:
+                if self.args.backend == 'async':
+                    # The async engine paces requests itself
+                    self.http = LCSCHttpBackend(pool_size=8, retries=0, min_interval=0)
+                else:
+                    self.http = LCSCHttpBackend(pool_size=max(2, self.per_host * 2))
+            return self.http
+
+    def run_job(self, job):
+        """Crawl and export one job with shared resources"""
+        args = self.args
+        scraper = scraper_class(job.category)(headless=self.headless, backend=args.backend,
+                                              network_idle=args.network_idle, extraction=args.extraction,
+                                              parser=args.parser, block=args.block,
+                                              parse_workers=args.parse_workers, brand=job.brand)
+        driver = None
+        started = time.perf_counter()
+        print(f"\n{'#'*60}\n▶️ Job {job} (priority {job.priority}): {job.url}\n{'#'*60}")
+        try:
+            if args.backend == 'selenium':
+                driver = self._acquire_driver(scraper)
+                scraper.setup_driver(driver)
+            else:
+                scraper.http = self._shared_http()
+            job.ok = crawl_and_export(scraper, job.url, args)
+            # Kept for --workbook, with the column widths tracked during the export
+            job.csv_file = os.path.join('Outputs', 'CSVs', f'{scraper.base_filename}.csv')
+            job.widths = scraper.column_widths
+        except Exception as e:
+            print(f"❌ Job {job} failed: {e}")
+            print("💾 Completed pages are checkpointed, run again with --resume to continue")
+        finally:
+            # The Selenium fallback of the HTTP backends may have started a browser of its own
+            if driver is None and scraper.driver:
+                scraper.driver.quit()
+            if driver is not None:
+                self._idle_drivers.put(driver)
+            job.seconds = time.perf_counter() - started
+            self._finish(job)
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            self.run_job(job)
+
+    def run(self):
+        """Run every queued job; returns True if all of them succeeded"""
+        started = time.perf_counter()
+        workers = max(1, min(self.parallel_jobs, len(self._queue)))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(self._worker) for _ in range(workers)]:
+                    future.result()
+        finally:
+            self.close()
+        saved = self.save_workbook(self.workbook) if self.workbook else True
+        self.print_summary(time.perf_counter() - started)
+        return saved and all(job.ok for job in self.jobs)
+
+    def save_workbook(self, path):
+        """Collect the successful jobs' CSV exports into one workbook, a sheet per category"""
+        jobs = [job for job in self.jobs if job.ok]
+        if not jobs:
+            return False
+        try:
+            workbook = ExcelWorkbook(path)
+        except ImportError:
+            print("✗ --workbook requires openpyxl (pip install openpyxl)")
+            return False
+        categories = [job.category for job in jobs]
+        try:
+            for job in jobs:
+                # A category crawled for several brands gets a sheet per brand
+                title = job.category if categories.count(job.category) == 1 else str(job)
+                workbook.add_csv_sheet(title, job.csv_file, job.widths)
+            workbook.save()
+        except Exception as e:
+            print(f"✗ Error saving workbook {path}: {e}")
+            return False
+        sheets = ', '.join(f'{title} ({count})' for title, count in workbook.counts.items())
+        print(f"📒 Saved {len(jobs)} sheets to {path}: {sheets}")
+        return True
+
+    def print_summary(self, seconds):
+        """Print per-job results and shared resource usage"""
+        print(f"\n{'='*60}")
+        print("CRAWL SCHEDULER SUMMARY")
+        print('='*60)
+        for job in self.finished:
+            status = "✓" if job.ok else "✗"
+            print(f"{status} {str(job):30} {job.seconds:8.1f}s")
+        if self.args.backend == 'selenium':
+            print(f"🌐 {self.drivers_started} browser(s) started for {len(self.jobs)} jobs")
+        print(f"⏱️ Total: {seconds:.1f}s with up to {self.parallel_jobs} jobs in parallel, "
+              f"{self.per_host} per host")
+
+    def close(self):
+        """Quit the pooled drivers and close the shared HTTP session"""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers = []
+        if self.http:
+            self.http.close()
+            self.http = None
+
+
+def main():
+    parser = build_arg_parser("Crawl several LCSC categories and brands in one process")
+    parser.add_argument('jobs', nargs='+', metavar='JOB',
+                        help="CATEGORY[:BRAND[:PRIORITY]], e.g. Resistors or Capacitors:FOJAN:0")
+    parser.add_argument('--parallel-jobs', type=int, default=1,
+                        help="number of jobs crawled at the same time (default 1)")
+    parser.add_argument('--per-host', type=int, default=1,
+                        help="maximum concurrent jobs against one host (default 1)")
+    parser.add_argument('--headed', action='store_true',
+                        help="show the browser windows (default headless)")
+    parser.add_argument('--workbook', metavar='PATH',
+                        help="also write one Excel workbook with a sheet per category, "
+                             "e.g. Outputs/Excels/FOJAN.xlsx")
+    args = parser.parse_args()
+
+    print("="*60)
+    print("LCSC Crawl Scheduler")
+    print("="*60)
+    check_environment(args)
+
+    try:
+        jobs = [CrawlJob.parse(text) for text in args.jobs]
+    except ValueError as e:
+        parser.error(str(e))
+
+    scheduler = CrawlScheduler(args, args.parallel_jobs, args.per_host, headless=not args.headed,
+                               workbook=args.workbook)
+    for job in jobs:
+        scheduler.add(job)
+    sys.exit(0 if scheduler.run() else 1)
+
+
+if __name__ == "__main__":
+    main()
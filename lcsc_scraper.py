@@ -0,0 +1,1365 @@
+"""
+Shared scraper for LCSC category listings.
+
+LCSCScraper holds everything the category scrapers have in common: the
+Selenium / HTTP / async fetch paths, caching, checkpoints, incremental
+state, row parsing and the JSON/CSV/Excel exports. A category only declares
+its listing (CATEGORY_ID), its output name and the table columns it reads:
+
+    class LCSCSeleniumScraper(LCSCScraper):
+        CATEGORY = 'Resistors'
+        LABEL = 'resistor'
+        CATEGORY_ID = 1199
+        COLUMNS = {'Package': (('Package', 'Pkg.'), 6), ...}
+
+main(scraper_class) runs the interactive command line scraper for one
+category and crawl_and_export() runs one (category, brand) crawl, so the
+crawl scheduler can drive many categories from one process.
+"""
+import sys
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from bs4 import BeautifulSoup
+import time
+import json
+import random
+import os
+import argparse
+import asyncio
+import importlib.util
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from lcsc_http import LCSCHttpBackend, RateLimiter, build_page_url, parse_total_pages
+from lcsc_async import AsyncCrawlEngine
+from lcsc_cache import PageCache
+from lcsc_catalog import Catalog
+from lcsc_checkpoint import CrawlCheckpoint
+from lcsc_delta import DeltaTracker, page_signature
+from lcsc_detail import DetailEnricher
+from lcsc_excel import ColumnWidths, ExcelWorkbook, ExcelWriter, product_rows
+from lcsc_index import PartIndex
+from lcsc_parquet import PARQUET_AVAILABLE, ParquetWriter
+from lcsc_stream import (JSON_FORMATS, CsvRowWriter, ProductStream, ProductSummary, iter_products,
+                         json_writer, write_concurrently, zstd_available)
+from lcsc_browser import PageReadyWaiter, ResourceFilter, parse_block_categories
+from lcsc_columns import ColumnMap
+from lcsc_rows import (EXTRACT_ROWS_SCRIPT, FAST_PARSER_AVAILABLE, HEADER_SCRIPT, page_to_records,
+                       page_to_table, product_link, soup_row_to_record, soup_table_header, table_header)
+from product_records import Product
+
+BRANDS = {'FOJAN': 13046}
+
+
+class LCSCScraper:
+    """Scrape one LCSC category listing (subclassed per category)"""
+    CATEGORY = None     # output name, e.g. 'Resistors'
+    LABEL = None        # singular name for messages, e.g. 'resistor'
+    CATEGORY_ID = None  # LCSC category page id
+    # Listing columns read by parse_row_record: header names, legacy cell index
+    COLUMNS = {}
+    SHEET_TITLE = "LCSC Products"
+    
+    def __init__(self, headless=False, backend='selenium', network_idle=False, extraction='html',
+                 parser='bs4', block=None, parse_workers=0, brand='FOJAN'):
+        self.headless = headless
+        self.brand = brand
+        self.backend = backend
+        self.network_idle = network_idle
+        self.extraction = extraction
+        self.parser = parser
+        self.parse_workers = parse_workers
+        self.checkpoint = None
+        self.cache = None
+        self.offline = False
+        self.delta = None
+        self.reached_last_page = False
+        # Set by the backends only when the crawl got to its last page with none skipped
+        self.crawl_complete = False
+        self.skipped_pages = []
+        self.driver = None
+        self.waiter = None
+        self.resource_filter = ResourceFilter(block) if block else None
+        self.http = None
+        self.all_products = []
+        self.stream = None
+        self.stream_summary = None
+        self.part_index = None
+        self.parquet = False
+        self.column_widths = None
+        self.json_format = 'json'
+        # In-process dedup on both part numbers (the part index persists across runs)
+        self.seen_part_numbers = set()
+        self.seen_supplier_numbers = set()
+        self.columns = ColumnMap(self.CATEGORY, self.COLUMNS)
+        
+    @classmethod
+    def category_url(cls, brand='FOJAN'):
+        """Return the listing url of this category for a brand name (or LCSC brand id)"""
+        return f'https://www.lcsc.com/category/{cls.CATEGORY_ID}.html?brand={BRANDS.get(brand, brand)}'
+    
+    @property
+    def base_filename(self):
+        """Output file name without extension, e.g. 'Resistors-FOJAN'"""
+        return f'{self.CATEGORY}-{self.brand}'
+    
+    @property
+    def product_count(self):
+        """Unique products scraped so far (also when streaming without all_products)"""
+        return len(self.seen_part_numbers)
+    
+    def export_fields(self, detail=None):
+        """Column order of the CSV and Excel exports"""
+        fields = ['Manufacturer Part Number', 'Supplier Part Number', 'Description'] + list(self.COLUMNS) + ['Link']
+        # Detail page fields, once products have been enriched (streams decide up front)
+        if detail is None:
+            detail = any('Stock' in product or 'Datasheet' in product for product in self.all_products)
+        if detail:
+            fields += ['Stock', 'Datasheet']
+        return fields
+    
+    def setup_driver(self, driver=None):
+        """Setup Chrome driver with options (or adopt an already running one)"""
+        self.driver = driver or self.create_driver()
+        self.waiter = PageReadyWaiter(self.driver, network_idle=self.network_idle)
+        
+    def create_driver(self):
+        """Create a configured Chrome driver (also used by parallel workers)"""
+        chrome_options = Options()
+        if self.headless:
+            chrome_options.add_argument('--headless')
+        
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument('--start-maximized')
+        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        if self.resource_filter:
+            self.resource_filter.configure(chrome_options)
+        
+        driver = webdriver.Chrome(options=chrome_options)
+        # Browsers started after the baseline page block resources right away
+        if self.resource_filter and self.resource_filter.type_sizes is not None:
+            self.resource_filter.apply(driver)
+        # Explicit waits only: an implicit wait would stretch every find_elements poll
+        driver.implicitly_wait(0)
+        
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return driver
+        
+    def safe_click_next_button(self):
+        """Click the next button and wait until the product table is replaced"""
+        try:
+            next_button = WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'button[aria-label="Next page"]'))
+            )
+            
+            # Check if button is disabled
+            if 'disabled' in next_button.get_attribute('class') or not next_button.is_enabled():
+                print("Next button is disabled - reached last page")
+                self.reached_last_page = True
+                return False
+            
+            # Remember the current first row so we can tell when it is replaced
+            old_row, old_id = self.waiter.first_row()
+            
+            # JavaScript click (bypasses overlay issues, no scrolling needed)
+            self.driver.execute_script("arguments[0].click();", next_button)
+            print("✓ Clicked next button using JavaScript")
+            
+            # Wait until the old rows go stale or the first productId changes
+            if self.waiter.wait_for_replacement(old_row, old_id):
+                print("✓ New page loaded successfully")
+                return True
+            print("⚠️ Products didn't load after clicking next")
+            return False
+                
+        except (TimeoutException, NoSuchElementException):
+            print("❌ Could not find next page button")
+            return False
+        except Exception as e:
+            print(f"❌ Error clicking next button: {e}")
+            return False
+    
+    def resume_from_checkpoint(self, url):
+        """Rebuild results from the checkpoint log; returns the next page to crawl"""
+        checkpoint_url, last_page, products = self.checkpoint.load()
+        if checkpoint_url != url:
+            print("⚠️ Checkpoint belongs to a different url, starting from page 1")
+            self.checkpoint.start(url)
+            return 1
+        
+        self.seen_part_numbers = {product['Manufacturer Part Number'] for product in products}
+        self.seen_supplier_numbers = {product.get('Supplier Part Number') for product in products} - {None}
+        self.emit(products)
+        print(f"♻️ Resumed {len(products)} products from {last_page} completed pages")
+        return last_page + 1
+    
+    def skip_page(self, page):
+        """Note a listing page that could not be crawled (the crawl is then incomplete)"""
+        print(f"⚠️ Page {page} could not be fetched, skipping")
+        self.skipped_pages.append(page)
+    
+    def record_checkpoint(self, page, products):
+        """Append a completed page to the checkpoint log (if enabled)"""
+        # --resume continues after the last logged page, so nothing past a skipped page is logged
+        if self.checkpoint and not self.skipped_pages:
+            self.checkpoint.record_page(page, products)
+    
+    def cache_page(self, page_url, data, kind='page'):
+        """Store a fetched page (or row payload) in the page cache (if enabled)"""
+        if self.cache:
+            self.cache.put(page_url, data, kind)
+    
+    def replay_from_cache(self, url, max_pages=None, start_page=1):
+        """Replay listing pages from the page cache.
+        
+        Returns the first page that still has to be crawled, or None when
+        every page was replayed (or nothing more can be done offline).
+        """
+        total_pages = self.cache.get(url, kind='page-count')
+        page = start_page
+        while True:
+            if (max_pages and page > max_pages) or (total_pages and page > int(total_pages)):
+                self.crawl_complete = True
+                return None
+            
+            page_url = build_page_url(url, page)
+            if self.extraction == 'script':
+                payload = self.cache.get(page_url, kind='records')
+                if payload is None:
+                    break
+                payload = json.loads(payload)
+                # Entries cached before the header was stored are a bare row list
+                if isinstance(payload, list):
+                    payload = {'header': None, 'rows': payload}
+                products = self.handle_page(page, records=payload['rows'], header=payload['header'])
+            else:
+                html = self.cache.get(page_url)
+                if html is None:
+                    break
+                products = self.handle_page(page, html=html)
+            print(f"♻️ Replayed {len(products)} products from cached page {page}")
+            page += 1
+        
+        if self.offline:
+            print(f"⏹️ Offline mode: page {page} is not cached, stopping")
+            return None
+        return page
+    
+    def scrape(self, url, max_pages=None, start_page=1, workers=1):
+        """Replay cached pages, then crawl the rest with the configured backend"""
+        if self.cache:
+            # Offline runs end here, whatever the backend
+            start_page = self.replay_from_cache(url, max_pages, start_page)
+            if start_page is None:
+                print(f"📦 Total unique products: {self.product_count}")
+                return self.all_products
+        
+        if workers > 1 and self.backend == 'selenium':
+            return self.scrape_pages_parallel(url, workers, max_pages, start_page=start_page)
+        return self.scrape_page(url, max_pages, start_page)
+    
+    def scrape_page(self, url, max_pages=None, start_page=1):
+        """Scrape pages using Selenium to handle JavaScript"""
+        if self.backend in ('http', 'async'):
+            if self.backend == 'async':
+                products = self.scrape_page_async(url, max_pages, start_page)
+            else:
+                products = self.scrape_page_http(url, max_pages, start_page)
+            if products is not None:
+                return products
+            print("⚠️ HTTP backend returned no product rows, falling back to Selenium")
+        
+        if not self.driver:
+            self.setup_driver()
+        
+        page_url = build_page_url(url, start_page)
+        print(f"Navigating to: {page_url}")
+        self.driver.get(page_url)
+        
+        # Pipelined mode: page sources are parsed in worker processes while the
+        # browser moves on; results are handled in page order as they finish
+        parse_pool = None
+        pending = deque()
+        if self.parse_workers and self.extraction == 'html':
+            parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            print(f"🧵 Parsing pages in {self.parse_workers} background workers")
+        
+        try:
+            self.crawl_with_driver(url, max_pages, start_page, parse_pool, pending)
+        finally:
+            if parse_pool:
+                self.drain_parsed(pending, wait=True)
+                parse_pool.shutdown()
+        
+        print(f"\n{'='*60}")
+        print(f"🎉 Scraping complete!")
+        print(f"📄 Total pages scraped: {self.pages_scraped}")
+        print(f"📦 Total unique products: {self.product_count}")
+        self.waiter.print_summary()
+        if self.resource_filter:
+            self.resource_filter.print_summary()
+        
+        if self.reached_last_page:
+            self.cache_page(url, str(self.last_page), kind='page-count')
+        
+        return self.all_products
+    
+    def crawl_with_driver(self, url, max_pages, start_page, parse_pool=None, pending=None):
+        """Click through the listing from start_page, handing every page to handle_page (or the parse pool)"""
+        current_page = start_page
+        self.pages_scraped = 0
+        
+        while True:
+            self.last_page = current_page
+            print(f"\n{'='*60}")
+            print(f"Processing page {current_page}")
+            
+            # Wait for products to load (page turns already waited in safe_click_next_button)
+            if current_page == start_page and not self.waiter.wait_for_rows():
+                print("❌ No products found or page didn't load properly")
+                break
+            
+            # Extract products (one in-page script, or page source + HTML parser)
+            page_url = build_page_url(url, current_page)
+            if self.extraction == 'script':
+                header = self.driver.execute_script(HEADER_SCRIPT)
+                records = self.driver.execute_script(EXTRACT_ROWS_SCRIPT)
+                payload = {'header': header, 'rows': records}
+                self.cache_page(page_url, json.dumps(payload, ensure_ascii=False), kind='records')
+                products = self.handle_page(current_page, records=records, header=header)
+            else:
+                page_source = self.driver.page_source
+                self.cache_page(page_url, page_source)
+                if parse_pool:
+                    pending.append((current_page, parse_pool.submit(page_to_table, page_source, self.parser)))
+                    print(f"📨 Page {current_page} queued for parsing")
+                    products = None
+                else:
+                    products = self.handle_page(current_page, html=page_source)
+            if self.resource_filter:
+                self.resource_filter.report_page(self.driver, current_page)
+            
+            if products is not None:
+                print(f"✓ Added {len(products)} products from page {current_page}")
+                print(f"📊 Total products: {self.product_count}")
+            if parse_pool:
+                self.drain_parsed(pending)
+            
+            self.pages_scraped += 1
+            
+            # Check if we've reached max pages
+            if max_pages and current_page >= max_pages:
+                print(f"\n⏹️ Reached maximum page limit ({max_pages})")
+                self.crawl_complete = True
+                break
+            
+            # Try to go to next page
+            success = self.safe_click_next_button()
+            
+            if not success:
+                # Only a disabled next button means the listing ended
+                self.crawl_complete = self.reached_last_page
+                if not self.reached_last_page:
+                    print("\n⏹️ Cannot navigate to next page, stopping")
+                break
+            
+            current_page += 1
+            
+            # Random delay to be respectful
+            delay = random.uniform(2, 4)
+            print(f"⏳ Waiting {delay:.1f} seconds before next page...")
+            time.sleep(delay)
+    
+    def drain_parsed(self, pending, wait=False):
+        """Hand finished parse results to handle_page in page order"""
+        while pending and (wait or pending[0][1].done()):
+            page, future = pending.popleft()
+            header, records = future.result()
+            products = self.handle_page(page, records=records, header=header)
+            print(f"✓ Added {len(products)} products from page {page}")
+            print(f"📊 Total products: {self.product_count}")
+    
+    def scrape_page_http(self, url, max_pages=None, start_page=1):
+        """Scrape listing pages over HTTP without a browser.
+        
+        Returns None when the first page has no product rows (e.g. the site
+        only renders them with JavaScript) so the caller can fall back to Selenium.
+        """
+        try:
+            if not self.http:
+                self.http = LCSCHttpBackend()
+        except ImportError:
+            print("⚠️ requests not installed (pip install requests)")
+            return None
+        
+        current_page = start_page
+        total_pages = None
+        previous_signature = None
+        
+        while True:
+            print(f"\n{'='*60}")
+            print(f"Fetching page {current_page} over HTTP")
+            
+            html = self.http.fetch_page(url, current_page)
+            if html is None:
+                if current_page == start_page:
+                    return None
+                print(f"⏹️ Page {current_page} could not be fetched, stopping")
+                break
+            
+            self.cache_page(build_page_url(url, current_page), html)
+            # The cheap page signature (row count, first/last part) avoids parsing here
+            signature = page_signature(html=html)
+            if signature.startswith('0:'):
+                if current_page == start_page:
+                    return None
+                print("⏹️ No product rows on this page, stopping")
+                # The listing ended, unless it announced more pages than this
+                self.crawl_complete = not total_pages or current_page > total_pages
+                break
+            
+            # Out of range pages may be answered with the last page again
+            if signature == previous_signature:
+                print("⏹️ Page repeats the previous one, stopping")
+                self.crawl_complete = not total_pages or current_page > total_pages
+                break
+            previous_signature = signature
+            
+            if total_pages is None:
+                total_pages = parse_total_pages(BeautifulSoup(html, 'html.parser'))
+                if total_pages:
+                    print(f"📄 Listing has {total_pages} pages")
+                    self.cache_page(url, str(total_pages), kind='page-count')
+            
+            products = self.handle_page(current_page, html=html)
+            
+            print(f"✓ Added {len(products)} products from page {current_page}")
+            print(f"📊 Total products: {self.product_count}")
+            
+            if max_pages and current_page >= max_pages:
+                print(f"\n⏹️ Reached maximum page limit ({max_pages})")
+                self.crawl_complete = True
+                break
+            if total_pages and current_page >= total_pages:
+                self.crawl_complete = True
+                break
+            
+            current_page += 1
+        
+        print(f"\n{'='*60}")
+        print(f"🎉 Scraping complete!")
+        print(f"📄 Total pages scraped: {current_page - start_page + 1}")
+        print(f"📦 Total unique products: {self.product_count}")
+        
+        return self.all_products
+    
+    def scrape_page_async(self, url, max_pages=None, start_page=1):
+        """Scrape listing pages with the asyncio crawl engine.
+        
+        Pages are fetched concurrently under a per-host token bucket with
+        AIMD concurrency control, then parsed in page order. Returns None
+        when the first page has no product rows so the caller can fall back
+        to Selenium.
+        """
+        try:
+            # A shared session (crawl scheduler) stays open for the next job
+            engine = AsyncCrawlEngine(backend=self.http)
+        except ImportError:
+            print("⚠️ requests not installed (pip install requests)")
+            return None
+        
+        try:
+            return asyncio.run(self._scrape_async(engine, url, max_pages, start_page))
+        finally:
+            engine.print_stats()
+            if engine.backend is not self.http:
+                engine.close()
+    
+    async def _scrape_async(self, engine, url, max_pages, start_page):
+        first_page_html = None
+        async for _, html in engine.crawl([build_page_url(url, 1)]):
+            first_page_html = html
+        if first_page_html is None:
+            return None
+        
+        soup = BeautifulSoup(first_page_html, 'html.parser')
+        if not soup.find('tr', id=lambda x: x and 'productId' in x):
+            return None
+        self.cache_page(build_page_url(url, 1), first_page_html)
+        
+        total_pages = parse_total_pages(soup)
+        if not total_pages:
+            print("⚠️ Could not read the page count, continuing page by page over HTTP")
+            return self.scrape_page_http(url, max_pages, start_page)
+        self.cache_page(url, str(total_pages), kind='page-count')
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+        print(f"📄 Listing has {total_pages} pages")
+        
+        if start_page == 1:
+            products = self.handle_page(1, html=first_page_html)
+            print(f"✓ Added {len(products)} products from page 1")
+        
+        first_page = max(2, start_page)
+        page_urls = [build_page_url(url, page) for page in range(first_page, total_pages + 1)]
+        async for index, html in engine.crawl(page_urls):
+            page = index + first_page
+            if html is None:
+                self.skip_page(page)
+                continue
+            self.cache_page(build_page_url(url, page), html)
+            products = self.handle_page(page, html=html)
+            print(f"✓ Added {len(products)} products from page {page}")
+            print(f"📊 Total products: {self.product_count}")
+        
+        self.crawl_complete = not self.skipped_pages
+        
+        print(f"\n{'='*60}")
+        print(f"🎉 Scraping complete!")
+        print(f"📄 Total pages scraped: {total_pages - start_page + 1 - len(self.skipped_pages)}")
+        print(f"📦 Total unique products: {self.product_count}")
+        
+        return self.all_products
+    
+    def scrape_pages_parallel(self, url, workers=4, max_pages=None, min_interval=1.5, start_page=1):
+        """Scrape pages with several browser workers using direct page urls.
+        
+        The total page count is read once, the page range is split into
+        contiguous shards (one per worker). Finished pages are merged back in
+        page order while the workers run, as soon as every earlier page is
+        in, so they are checkpointed and streamed during the crawl. All
+        workers share one politeness budget of min_interval seconds between
+        page loads.
+        """
+        if not self.driver:
+            self.setup_driver()
+        
+        print(f"Navigating to: {url}")
+        self.driver.get(url)
+        
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "tr[id*='productId']"))
+            )
+        except TimeoutException:
+            print("❌ No products found or page didn't load properly")
+            return self.all_products
+        
+        first_page_html = self.driver.page_source
+        if self.resource_filter:
+            self.resource_filter.report_page(self.driver, 1)
+        self.cache_page(build_page_url(url, 1), first_page_html)
+        total_pages = parse_total_pages(BeautifulSoup(first_page_html, 'html.parser'))
+        if not total_pages:
+            print("⚠️ Could not read the page count, falling back to sequential scraping")
+            return self.scrape_page(url, max_pages, start_page)
+        
+        self.cache_page(url, str(total_pages), kind='page-count')
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+        print(f"📄 Listing has {total_pages} pages, using {workers} workers")
+        
+        # Workers report (page, result) and None when their shard ends; a result of None is a failed page
+        finished_pages = queue.Queue()
+        page_results = {}
+        if start_page == 1:
+            page_results[1] = page_to_table(first_page_html, self.parser)
+        remaining = list(range(max(2, start_page), total_pages + 1))
+        workers = max(1, min(workers, len(remaining)))
+        shard_size = -(-len(remaining) // workers) if remaining else 0
+        shards = [remaining[i:i + shard_size] for i in range(0, len(remaining), shard_size or 1)]
+        rate_limiter = RateLimiter(min_interval)
+        
+        def crawl_shard(pages):
+            try:
+                driver = self.create_driver()
+                try:
+                    for page in pages:
+                        rate_limiter.wait()
+                        driver.get(build_page_url(url, page))
+                        try:
+                            WebDriverWait(driver, 15).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, "tr[id*='productId']"))
+                            )
+                        except TimeoutException:
+                            print(f"⚠️ Products didn't load on page {page}")
+                            finished_pages.put((page, None))
+                            continue
+                        page_source = driver.page_source
+                        self.cache_page(build_page_url(url, page), page_source)
+                        finished_pages.put((page, page_to_table(page_source, self.parser)))
+                        print(f"✓ Worker parsed page {page}")
+                        if self.resource_filter:
+                            self.resource_filter.report_page(driver, page)
+                finally:
+                    driver.quit()
+            finally:
+                finished_pages.put(None)
+        
+        next_page = start_page
+        
+        def merge_ready():
+            # Hand the contiguous run of finished pages to handle_page (checkpoints, streams, catalog)
+            # in page order, so deduplication keeps the first occurrence
+            nonlocal next_page
+            while next_page in page_results:
+                result = page_results.pop(next_page)
+                if result is None:
+                    self.skip_page(next_page)
+                else:
+                    header, records = result
+                    self.handle_page(next_page, records=records, header=header)
+                next_page += 1
+        
+        merge_ready()
+        if shards:
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [executor.submit(crawl_shard, shard) for shard in shards]
+                running = len(futures)
+                while running:
+                    finished = finished_pages.get()
+                    if finished is None:
+                        running -= 1
+                        continue
+                    page, result = finished
+                    page_results[page] = result
+                    merge_ready()
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"❌ Worker failed: {e}")
+        
+        # Pages a failed worker never reached
+        for page in range(next_page, total_pages + 1):
+            page_results.setdefault(page, None)
+        merge_ready()
+        self.crawl_complete = not self.skipped_pages
+        
+        print(f"\n{'='*60}")
+        print(f"🎉 Scraping complete!")
+        print(f"📄 Total pages scraped: {total_pages - start_page + 1 - len(self.skipped_pages)}")
+        if self.skipped_pages:
+            print(f"⚠️ Pages that failed to load: {self.skipped_pages}")
+        print(f"📦 Total unique products: {self.product_count}")
+        if self.resource_filter:
+            self.resource_filter.print_summary()
+        
+        return self.all_products
+    
+    def benchmark_extraction(self, url, pages=3, rounds=3):
+        """Time page_source + BeautifulSoup against the in-page script extraction"""
+        if not self.driver:
+            self.setup_driver()
+        
+        print(f"Navigating to: {url}")
+        self.driver.get(url)
+        if not self.waiter.wait_for_rows():
+            print("❌ No products found or page didn't load properly")
+            return
+        
+        html_times = []
+        script_times = []
+        for page in range(1, pages + 1):
+            for _ in range(rounds):
+                started = time.perf_counter()
+                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                product_rows = soup.find_all('tr', id=lambda x: x and 'productId' in x)
+                html_products = self.parse_records(soup_row_to_record(row) for row in product_rows)
+                html_times.append(time.perf_counter() - started)
+                
+                started = time.perf_counter()
+                script_products = self.parse_records(self.driver.execute_script(EXTRACT_ROWS_SCRIPT))
+                script_times.append(time.perf_counter() - started)
+            
+            print(f"Page {page}: page_source+BeautifulSoup {html_times[-1]*1000:.0f} ms, "
+                  f"in-page script {script_times[-1]*1000:.0f} ms, "
+                  f"outputs match: {html_products == script_products}")
+            
+            if page < pages and not self.safe_click_next_button():
+                break
+        
+        html_avg = sum(html_times) / len(html_times)
+        script_avg = sum(script_times) / len(script_times)
+        print(f"\n{'='*60}")
+        print("EXTRACTION BENCHMARK (per page)")
+        print('='*60)
+        print(f"page_source + BeautifulSoup : {html_avg*1000:8.1f} ms")
+        print(f"in-page script              : {script_avg*1000:8.1f} ms")
+        print(f"saved per page              : {(html_avg - script_avg)*1000:8.1f} ms "
+              f"({html_avg / script_avg if script_avg else 0:.1f}x faster)")
+    
+    def extract_products(self, soup):
+        """Extract products from page"""
+        return self.dedupe_products(self.parse_products(soup))
+    
+    def parse_products(self, soup):
+        """Parse every product row on a page (no deduplication)"""
+        product_rows = soup.find_all('tr', id=lambda x: x and 'productId' in x)
+        
+        print(f"Found {len(product_rows)} product rows")
+        
+        self.columns.update(soup_table_header(soup))
+        return self.parse_records(soup_row_to_record(row) for row in product_rows)
+    
+    def handle_page(self, page, html=None, records=None, header=None):
+        """Turn one listing page (HTML or row records + header) into new unique products.
+        
+        The table header refreshes the column map before rows are parsed.
+        In incremental mode a page whose signature matches the last run
+        reuses the previous snapshot's products without parsing. The
+        products are deduplicated, emitted (see emit) and checkpointed.
+        """
+        products = None
+        if self.delta:
+            signature = page_signature(html=html, records=records)
+            products = self.delta.unchanged_products(page, signature)
+        
+        if products is None:
+            if records is None:
+                records = page_to_records(html, self.parser)
+            if header is None and html is not None:
+                header = table_header(html)
+            self.columns.update(header)
+            print(f"Found {len(records)} product rows")
+            products = self.parse_records(records)
+            if self.delta:
+                self.delta.record_page(page, signature, products)
+        else:
+            print(f"⏭️ Page {page} unchanged since last run, reusing {len(products)} products")
+        
+        products = self.dedupe_products(products)
+        if self.part_index:
+            self.part_index.claim(products)
+        self.emit(products)
+        self.record_checkpoint(page, products)
+        return products
+    
+    def emit(self, products):
+        """Hand new unique products to the export stream, or collect them in all_products"""
+        if self.stream:
+            self.stream.write(products)
+        else:
+            # Kept products are compact records (see product_records)
+            self.all_products.extend(map(Product.from_dict, products))
+    
+    def parse_records(self, records):
+        """Turn row records into product dicts, skipping 'Other Suppliers' rows"""
+        if self.part_index:
+            # Rows of parts another category / brand export owns are never parsed
+            records = self.part_index.filter_records(records)
+        products = []
+        for record in records:
+            if record['other_suppliers']:
+                continue
+            
+            product_data = self.parse_row_record(record)
+            if product_data and product_data.get('Manufacturer Part Number'):
+                products.append(product_data)
+        
+        return products
+    
+    def dedupe_products(self, products):
+        """Drop products whose manufacturer or supplier part number was already seen"""
+        unique_products = []
+        for product_data in products:
+            part_number = product_data['Manufacturer Part Number']
+            supplier_number = product_data.get('Supplier Part Number')
+            if part_number in self.seen_part_numbers or supplier_number in self.seen_supplier_numbers:
+                continue
+            self.seen_part_numbers.add(part_number)
+            if supplier_number:
+                self.seen_supplier_numbers.add(supplier_number)
+            unique_products.append(product_data)
+        return unique_products
+    
+    def parse_product_row(self, row):
+        """Parse a single product row"""
+        return self.parse_row_record(soup_row_to_record(row))
+    
+    def parse_row_record(self, record):
+        """Parse a single product row record (see lcsc_rows)"""
+        product_data = {}
+        
+        # Part Number
+        if record['part_number'] is not None:
+            product_data['Manufacturer Part Number'] = record['part_number']
+        
+        # LCSC Part Number
+        lcsc_text = record['lcsc_number']
+        if lcsc_text is not None and lcsc_text.startswith('C'):
+            product_data['Supplier Part Number'] = lcsc_text
+            product_data['Link'] = product_link(record['lcsc_href'])
+        
+        if 'Manufacturer Part Number' not in product_data:
+            return None
+        
+        # Description
+        if record['description'] is not None:
+            product_data['description'] = record['description']
+        
+        # Category columns such as Package, Resistance, Tolerance (located by table header)
+        specs = self.columns.values(record)
+        for field in self.COLUMNS:
+            value = specs.get(field)
+            if value and value != '-':
+                product_data[field] = value
+        
+        return product_data
+    
+    def save_export(self, writer):
+        """Write all products through one export writer (see save_all_formats); returns True on success"""
+        try:
+            writer.write(self.all_products)
+        except Exception as e:
+            print(f"✗ Error saving {writer.label}: {e}")
+            writer.close(commit=False)
+            return False
+        success = writer.close()
+        if success:
+            self.print_saved(writer)
+        return success
+    
+    def save_to_json(self, filename=None):
+        """Save products to a JSON or JSON Lines file (format from the extension)"""
+        if not self.all_products:
+            print("No products to save")
+            return False
+        try:
+            writer = json_writer(filename or f'{self.base_filename}.{self.json_format}')
+        except OSError as e:
+            print(f"✗ Error saving JSON: {e}")
+            return False
+        return self.save_export(writer)
+    
+    def save_to_csv(self, filename=None):
+        """Save products to CSV file"""
+        if not self.all_products:
+            print("No products to save")
+            return False
+        try:
+            writer = CsvRowWriter(filename or f'{self.base_filename}.csv', self.export_fields())
+        except OSError as e:
+            print(f"✗ Error saving CSV: {e}")
+            return False
+        return self.save_export(writer)
+    
+    def excel_fields(self):
+        """Excel columns: the export fields, then any other product keys (price breaks, attributes)"""
+        fields = self.export_fields()
+        extra = {}
+        for product in self.all_products:
+            for key in product:
+                if key not in extra:
+                    extra[key] = None
+        return fields + [key for key in extra if key not in fields and key != 'description']
+    
+    def save_to_excel(self, filename=None):
+        """Save products to Excel file (write-only workbook, see lcsc_excel)"""
+        if not self.all_products:
+            print("No products to save to Excel")
+            return False
+        
+        # Widths come from one pass over the products, the cells are never revisited
+        fields = self.excel_fields()
+        self.column_widths = ColumnWidths(fields)
+        self.column_widths.write(self.all_products)
+        try:
+            writer = ExcelWriter(filename or f'{self.base_filename}.xlsx', self.SHEET_TITLE, fields,
+                                 self.column_widths)
+        except ImportError:
+            print("✗ Excel export requires openpyxl.")
+            print("  Install with: pip install openpyxl")
+            return False
+        except OSError as e:
+            print(f"✗ Error saving Excel: {e}")
+            return False
+        return self.save_export(writer)
+    
+    def save_all_formats(self, base_filename=None):
+        """Save to all formats (JSON, CSV, Excel)"""
+        if not self.all_products:
+            print("No products to save")
+            return False
+        
+        if not base_filename:
+            base_filename = self.base_filename
+        
+         # Define folder structure
+        base_output_folder = "Outputs"
+        json_folder = os.path.join(base_output_folder, "JSONs")
+        csv_folder = os.path.join(base_output_folder, "CSVs")
+        excel_folder = os.path.join(base_output_folder, "Excels")
+
+        # Create folders if they don't exist
+        for folder in [base_output_folder, json_folder, csv_folder, excel_folder]:
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+                print(f"Created folder: {folder}")
+
+
+
+
+        print(f"\n{'='*60}")
+        print("SAVING TO ALL FORMATS")
+        print('='*60)
+        
+        results = []
+        
+        # JSON and CSV writers
+        json_file = os.path.join(json_folder, f'{base_filename}.{self.json_format}')
+        csv_file = os.path.join(csv_folder, f'{base_filename}.csv')
+        writers = [json_writer(json_file), CsvRowWriter(csv_file, self.export_fields())]
+        
+        # Excel writer (column widths have to be known before the first row)
+        excel_file = os.path.join(excel_folder, f'{base_filename}.xlsx')
+        fields = self.excel_fields()
+        self.column_widths = ColumnWidths(fields)
+        self.column_widths.write(self.all_products)
+        try:
+            writers.append(ExcelWriter(excel_file, self.SHEET_TITLE, fields, self.column_widths))
+        except ImportError:
+            print("✗ Excel export requires openpyxl.")
+            print("  Install with: pip install openpyxl")
+            results.append(('Excel', excel_file, False))
+        
+        # Parquet writer (typed columns, see lcsc_parquet)
+        if self.parquet:
+            writers.append(ParquetWriter(os.path.join(base_output_folder, "Parquets", f'{base_filename}.parquet'),
+                                         self.export_fields()))
+        
+        # Every writer runs on its own thread over the same product batches,
+        # into a part file that only replaces an export whose content changed
+        errors = write_concurrently(writers, self.all_products)
+        for writer, error in zip(writers, errors):
+            if error is not None:
+                print(f"✗ Error saving {writer.label}: {error}")
+                writer.close(commit=False)
+                success = False
+            else:
+                success = writer.close()
+                if success:
+                    self.print_saved(writer)
+            results.append((writer.label, writer.path, success))
+        
+        # Print summary
+        print(f"\n{'='*60}")
+        print("SAVE RESULTS SUMMARY")
+        print('='*60)
+        
+        for format_name, filename, success in results:
+            status = "✓ SUCCESS" if success else "✗ FAILED"
+            rel_path = os.path.relpath(filename, os.getcwd())
+            print(f"{format_name:7} : {status} - {rel_path}")
+        
+        return all([success for _, _, success in results])
+    
+    def open_stream(self, base_filename=None, detail=False, enrich=None, writers=()):
+        """Stream products into the JSON and CSV exports (and `writers`) as pages are parsed"""
+        if not base_filename:
+            base_filename = self.base_filename
+        json_file = os.path.join("Outputs", "JSONs", f'{base_filename}.{self.json_format}')
+        csv_file = os.path.join("Outputs", "CSVs", f'{base_filename}.csv')
+        
+        files = [json_writer(json_file), CsvRowWriter(csv_file, self.export_fields(detail))]
+        if self.parquet:
+            files.append(ParquetWriter(os.path.join("Outputs", "Parquets", f'{base_filename}.parquet'),
+                                       self.export_fields(detail)))
+        
+        # Excel is built from the JSON export at the end, with the columns (the export fields,
+        # then any other product keys as in excel_fields) and widths tracked while streaming
+        self.column_widths = ColumnWidths(self.export_fields(detail), extra_keys=True)
+        self.stream_summary = ProductSummary(self.summary_fields())
+        self.stream = ProductStream([*files, self.stream_summary, self.column_widths, *writers], enrich=enrich)
+        print(f"🌊 Streaming products to {', '.join(writer.path for writer in files)}")
+        return self.stream
+    
+    def finish_stream(self, base_filename=None, commit=True):
+        """Commit the streamed JSON/CSV files and build the Excel workbook from the JSON export"""
+        stream, self.stream = self.stream, None
+        stream.close(commit)
+        if not commit:
+            print("🗑️ Discarded the partial streamed exports")
+            return False
+        
+        if not base_filename:
+            base_filename = self.base_filename
+        print(f"\n{'='*60}")
+        print("SAVING TO ALL FORMATS")
+        print('='*60)
+        
+        # File writers carry a label, the summary and catalog writers do not
+        results = [(writer.label, writer.path, success) for writer, success in stream.results
+                   if hasattr(writer, 'label')]
+        for writer, success in stream.results:
+            if success and hasattr(writer, 'label'):
+                self.print_saved(writer)
+        
+        excel_file = os.path.join("Outputs", "Excels", f'{base_filename}.xlsx')
+        json_file, json_success = results[0][1], results[0][2]
+        excel_success = json_success and self.save_export_to_excel(json_file, excel_file, self.column_widths)
+        results.insert(2, ('Excel', excel_file, excel_success))
+        
+        # Print summary
+        print(f"\n{'='*60}")
+        print("SAVE RESULTS SUMMARY")
+        print('='*60)
+        
+        for format_name, filename, success in results:
+            status = "✓ SUCCESS" if success else "✗ FAILED"
+            rel_path = os.path.relpath(filename, os.getcwd())
+            print(f"{format_name:7} : {status} - {rel_path}")
+        
+        return all([success for _, _, success in results])
+    
+    def print_saved(self, writer):
+        """Report a committed export (unchanged files are kept as they were)"""
+        if writer.changed:
+            print(f"✓ Saved {writer.count} products to {writer.label}: {writer.path}")
+        else:
+            print(f"✓ {writer.label} unchanged, kept {writer.path}")
+    
+    def save_export_to_excel(self, json_file, filename, widths):
+        """Build the Excel workbook from a finished JSON export, one product at a time"""
+        try:
+            workbook = ExcelWorkbook(filename)
+        except ImportError:
+            print("✗ Streamed Excel export requires openpyxl.")
+            print("  Install with: pip install openpyxl")
+            return False
+        
+        try:
+            count = workbook.add_sheet(self.SHEET_TITLE, widths.fields,
+                                       product_rows(iter_products(json_file), widths.fields), widths)
+            if workbook.save():
+                print(f"✓ Saved {count} products to Excel: {filename}")
+            else:
+                print(f"✓ Excel unchanged, kept {filename}")
+            return True
+        except Exception as e:
+            print(f"✗ Error saving Excel: {e}")
+            return False
+    
+    def summary_fields(self):
+        """Fields listed in the completion statistics"""
+        return ['Manufacturer Part Number', 'Supplier Part Number', 'description'] + list(self.COLUMNS) + ['Link']
+    
+    def display_summary(self, summary=None):
+        """Display summary of scraped products (from all_products or a stream's ProductSummary)"""
+        if summary is None:
+            summary = ProductSummary(self.summary_fields())
+            summary.write(self.all_products)
+        if not summary.count:
+            print("No products to display")
+            return
+        
+        print("\n" + "="*60)
+        print(f"{self.CATEGORY.upper()} SUMMARY")
+        print("="*60)
+        print(f"Total unique products: {summary.count}")
+        
+        # Field completion statistics
+        print("\nField completion statistics:")
+        for field in summary.fields:
+            count = summary.filled[field]
+            percentage = (count / summary.count) * 100
+            print(f"  {field:25} {count:4}/{summary.count:4} ({percentage:5.1f}%)")
+        
+        print("\nFirst 3 products:")
+        print("-"*60)
+        for i, product in enumerate(summary.first, 1):
+            print(f"\n{i}. {product.get('Manufacturer Part Number', 'N/A')}")
+            print(f"   Supplier: {product.get('Supplier Part Number', 'N/A')}")
+            print(f"   Description: {product.get('description', 'N/A')[:80]}...")
+            print(f"   Package: {product.get('Package', 'N/A')}")
+            specs = [product.get(field, 'N/A') for field in self.COLUMNS if field != 'Package']
+            print(f"   Specs: {' | '.join(specs)}")
+    
+    def close(self):
+        """Close the driver and HTTP session"""
+        if self.driver:
+            self.driver.quit()
+        if self.http:
+            self.http.close()
+
+
+
+def build_arg_parser(description="Scrape FOJAN components from LCSC"):
+    """Return the command line options shared by the category scrapers and the scheduler"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--backend', choices=['selenium', 'http', 'async'], default='selenium',
+                        help="fetch listing pages with Chrome (default), over plain HTTP, "
+                             "or with the adaptive asyncio HTTP engine")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of parallel browser workers (pages are addressed directly)")
+    parser.add_argument('--network-idle', action='store_true',
+                        help="after each page turn also wait until no new network requests start")
+    parser.add_argument('--block', type=parse_block_categories, default=[], metavar='CATEGORIES',
+                        help="block browser resources we never read: 'all' or a comma list of "
+                             "images,fonts,stylesheets,media,trackers (default none)")
+    parser.add_argument('--extraction', choices=['html', 'script'], default='html',
+                        help="parse page_source with BeautifulSoup (default) or read rows with an in-page script")
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4',
+                        help="HTML parser for page source: BeautifulSoup (default) or the lxml fast path")
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help="parse page sources in N background processes while the browser "
+                             "loads the next page (default 0: parse inline)")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue the last interrupted crawl from its checkpoint")
+    parser.add_argument('--cache', action='store_true',
+                        help="replay listing pages from Outputs/Cache and cache newly fetched ones")
+    parser.add_argument('--cache-ttl', type=float, default=24,
+                        help="hours before a cached page expires (default 24)")
+    parser.add_argument('--offline', action='store_true',
+                        help="run only from the page cache, never touching the network")
+    parser.add_argument('--incremental', action='store_true',
+                        help="reuse unchanged listing pages from the last snapshot and merge into it")
+    parser.add_argument('--enrich', action='store_true',
+                        help="fetch product detail pages for stock, price breaks, datasheet and attributes")
+    parser.add_argument('--detail-workers', type=int, default=8,
+                        help="concurrent detail page fetches for --enrich (default 8)")
+    parser.add_argument('--dedup-index', action='store_true',
+                        help="skip parts another category or brand export already owns "
+                             "(persistent index in Outputs/State/parts.sqlite)")
+    parser.add_argument('--no-catalog', action='store_true',
+                        help="do not upsert the products into the Outputs/catalog.sqlite catalog")
+    parser.add_argument('--stream', action='store_true',
+                        help="write JSON/CSV rows as each page is parsed instead of keeping "
+                             "every product in memory")
+    parser.add_argument('--json-format', choices=JSON_FORMATS, default='json',
+                        help="JSON export as an indented array (default) or JSON Lines, "
+                             "optionally gzip / zstd compressed (Outputs/JSONs/<name>.jsonl.gz)")
+    parser.add_argument('--parquet', action='store_true',
+                        help="also export Outputs/Parquets/<name>.parquet with typed numeric columns")
+    return parser
+
+
+def check_environment(args):
+    """Check the Excel libraries and the requested parser; exits if nothing can write Excel"""
+    print("\nChecking for Excel export capabilities...")
+    # Only look the module up, it is imported when the workbook is written
+    if importlib.util.find_spec('openpyxl'):
+        print("✓ openpyxl library available for Excel export")
+    else:
+        print("✗ openpyxl not found.")
+        print("  Excel export will not be available.")
+        print("  Install with: pip install openpyxl")
+        sys.exit()
+    print("\n" + "="*60)
+    
+    if args.parser == 'lxml' and not FAST_PARSER_AVAILABLE:
+        print("⚠️ lxml fast parser not available, using BeautifulSoup")
+        print("  Install with: pip install lxml cssselect")
+        args.parser = 'bs4'
+    
+    if args.json_format == 'jsonl.zst' and not zstd_available():
+        print("⚠️ zstandard not available, writing uncompressed JSON Lines")
+        print("  Install with: pip install zstandard")
+        args.json_format = 'jsonl'
+    
+    if args.parquet and not PARQUET_AVAILABLE:
+        print("⚠️ pyarrow not available, skipping the Parquet export")
+        print("  Install with: pip install pyarrow")
+        args.parquet = False
+
+
+def crawl_and_export(scraper, url, args, max_pages=None):
+    """Crawl one listing with the cache/checkpoint/incremental options and export it.
+    
+    Returns True when the whole listing was crawled and every export succeeded.
+    """
+    base_filename = scraper.base_filename
+    scraper.parquet = args.parquet
+    scraper.json_format = args.json_format
+    
+    if args.cache or args.offline:
+        # Offline runs (e.g. CI replaying fixtures) never expire entries
+        ttl = 0 if args.offline else args.cache_ttl * 3600
+        scraper.cache = PageCache(os.path.join('Outputs', 'Cache'), ttl=ttl)
+        scraper.offline = args.offline
+    
+    enricher = None
+    if args.enrich:
+        enricher = DetailEnricher(workers=args.detail_workers, cache=scraper.cache, offline=args.offline)
+    
+    def enrich(products):
+        # Incremental runs only refetch details of new or changed parts
+        enricher.enrich(products, only=scraper.delta.changed_parts() if scraper.delta else None)
+    
+    if args.dedup_index:
+        # Shared by every category / brand export, see lcsc_index
+        scraper.part_index = PartIndex(os.path.join('Outputs', 'State', 'parts.sqlite'), base_filename)
+    
+    # The catalog is the system of record, the files below are exports of the same products
+    catalog = None
+    catalog_writer = None
+    if not args.no_catalog:
+        catalog = Catalog()
+        catalog_writer = catalog.writer(scraper.CATEGORY, scraper.brand)
+    
+    if args.stream:
+        # Streamed runs enrich and write every page (files and catalog) as it is parsed
+        scraper.open_stream(base_filename, detail=args.enrich, enrich=enrich if enricher else None,
+                            writers=[catalog_writer] if catalog_writer else [])
+    
+    try:
+        # Every completed page is checkpointed so a crash can be resumed
+        scraper.checkpoint = CrawlCheckpoint(os.path.join('Outputs', 'Checkpoints', f'{base_filename}.jsonl'))
+        start_page = 1
+        if args.resume and scraper.checkpoint.exists():
+            start_page = scraper.resume_from_checkpoint(url)
+        else:
+            if args.resume:
+                print("No checkpoint found, starting from page 1")
+            scraper.checkpoint.start(url)
+        
+        if args.incremental:
+            scraper.delta = DeltaTracker(os.path.join('Outputs', 'JSONs', f'{base_filename}.{scraper.json_format}'),
+                                         os.path.join('Outputs', 'State', f'{base_filename}.pages.json'))
+        
+        print("Try to scrape all pages")
+        print("\nAttempting to scrape all pages (this may take a while)...")
+        scraper.crawl_complete = False
+        scraper.skipped_pages = []
+        
+        # Start scraping (cached pages first, see scrape)
+        scraper.scrape(url, max_pages, start_page, workers=args.workers)
+        
+        if scraper.cache:
+            scraper.cache.print_stats()
+        
+        if scraper.part_index:
+            scraper.part_index.print_summary()
+        
+        complete = scraper.crawl_complete
+        if not complete:
+            skipped = f" (skipped pages: {scraper.skipped_pages})" if scraper.skipped_pages else ""
+            print(f"\n⚠️ The crawl stopped before the last listing page{skipped}")
+        
+        if scraper.delta:
+            scraper.delta.print_summary()
+            # A limited or incomplete crawl keeps the snapshot parts it did not reach
+            if max_pages is not None or not complete:
+                scraper.emit(scraper.dedupe_products(scraper.delta.unseen_products()))
+        
+        if not scraper.product_count:
+            print(f"\n❌ No {scraper.LABEL}s were scraped")
+            if scraper.stream:
+                scraper.finish_stream(commit=False)
+            return False
+        
+        print(f"\n✅ Successfully scraped {scraper.product_count} {scraper.LABEL}s")
+        
+        if enricher and not scraper.stream:
+            enrich(scraper.all_products)
+        
+        # Display summary
+        scraper.display_summary(scraper.stream_summary if scraper.stream else None)
+        
+        # Save options
+        if scraper.stream:
+            saved = scraper.finish_stream(base_filename)
+        else:
+            if catalog_writer:
+                # Upserted after enrichment, in batched transactions
+                for start in range(0, len(scraper.all_products), 500):
+                    catalog_writer.write(scraper.all_products[start:start + 500])
+            saved = scraper.save_all_formats(base_filename)
+        
+        # Only a complete crawl tells which parts are no longer listed
+        if catalog_writer and saved and complete and max_pages is None:
+            catalog_writer.prune()
+        if catalog_writer and saved:
+            catalog_writer.mark_saved()
+    except BaseException:
+        # Never leave half-written streamed files behind
+        if scraper.stream:
+            scraper.finish_stream(commit=False)
+        raise
+    finally:
+        if enricher:
+            enricher.close()
+        if scraper.part_index:
+            scraper.part_index.close()
+        if catalog:
+            catalog.close()
+    
+    if saved:
+        if complete:
+            scraper.checkpoint.clear()
+        if scraper.delta:
+            scraper.delta.save()
+    if saved and not complete:
+        print("\n⚠️ Export completed, but the crawl was incomplete")
+        print("💾 Completed pages are checkpointed, run again with --resume to continue")
+    else:
+        print("\n✅ Export completed!")
+    print("="*60)
+    return saved and complete
+
+
+def main(scraper_class):
+    """Interactive command line scraper for one category"""
+    parser = build_arg_parser(f"Scrape FOJAN {scraper_class.LABEL}s from LCSC")
+    parser.add_argument('--benchmark-extraction', action='store_true',
+                        help="time both extraction modes on the first pages and exit")
+    args = parser.parse_args()
+    
+    print("="*60)
+    print(f"LCSC {scraper_class.LABEL.upper()} Scraper - FOJAN Brand")
+    print("="*60)
+    
+    check_environment(args)
+    
+    try:
+        # Ask if user wants to run in headless mode
+        headless_input = input("Run in background (headless mode)? (y/n, default=n): ").strip().lower()
+        headless = headless_input == 'y'
+        
+        scraper = scraper_class(headless=headless, backend=args.backend,
+                                network_idle=args.network_idle, extraction=args.extraction,
+                                parser=args.parser, block=args.block,
+                                parse_workers=args.parse_workers)
+        
+        url = scraper_class.category_url(scraper.brand)
+        
+        if args.benchmark_extraction:
+            scraper.benchmark_extraction(url)
+            scraper.close()
+            return
+        
+        max_pages = None # Replace None with a number to limit pages
+        crawl_and_export(scraper, url, args, max_pages)
+        
+        # Ask if user wants to keep browser open
+        keep_open = input("\nKeep browser window open for inspection? (y/n, default=n): ").strip().lower()
+        if keep_open != 'y':
+            scraper.close()
+            print("Browser closed.")
+        else:
+            print("Browser window will remain open. Close it manually when done.")
+        
+    except ImportError:
+        print("\n❌ Selenium not installed.")
+        print("Install with: pip install selenium")
+        print("Also download ChromeDriver from: https://chromedriver.chromium.org/")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("💾 Completed pages are checkpointed, run again with --resume to continue")
+        try:
+            scraper.close()
+        except:
+            pass
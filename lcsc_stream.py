@@ -0,0 +1,345 @@
+"""
+Streaming product export for the LCSC scrapers.
+
+With --stream the scraper keeps no all_products list. The new unique
+products of every page go to a ProductStream as soon as the page is
+parsed, and the stream fans them out to incremental writers:
+
+    JsonArrayWriter   Outputs/JSONs/<name>.json  (same layout as json.dump(indent=2))
+    JsonLinesWriter   Outputs/JSONs/<name>.jsonl[.gz|.zst]  with --json-format jsonl...
+    CsvRowWriter      Outputs/CSVs/<name>.csv
+    ProductSummary    field completion counts and the first products, for the summary
+    ParquetWriter     Outputs/Parquets/<name>.parquet with --parquet (see lcsc_parquet)
+
+The writers fill '<file>.part' files and only replace the real exports
+when the crawl finished, so an interrupted run never leaves a truncated
+file behind. The part files are flushed after every page, before the page
+is checkpointed (the Parquet writer still buffers whole row groups). Memory stays flat whatever the catalog size. An export whose
+content did not change is not replaced at all (commit_file), so its mtime
+still tells downstream builds that nothing needs regenerating.
+
+save_all_formats hands the same product batches to every writer at once,
+each writer on its own thread (write_concurrently).
+
+iter_products() reads any of those exports back one product at a time
+(the format comes from the file extension), which is how the Altium
+generators consume them:
+
+    for product in iter_products('Outputs/JSONs/Resistors-FOJAN.jsonl.gz'):
+        ...
+
+.gz files use the standard library; .zst files need zstandard
+(pip install zstandard).
+"""
+import csv
+import gzip
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from product_records import Product, json_default
+
+# JSON export formats, in the order --json-format lists them
+JSON_FORMATS = ('json', 'jsonl', 'jsonl.gz', 'jsonl.zst')
+
+_WHITESPACE_RE = re.compile(r'[\s,]*')
+
+
+def _codec(path):
+    """Compression of a file from its extension ('gz', 'zst' or None)"""
+    for codec in ('gz', 'zst'):
+        if path.endswith('.' + codec):
+            return codec
+    return None
+
+
+def zstd_available():
+    """True if .zst exports can be written and read"""
+    return importlib.util.find_spec('zstandard') is not None
+
+
+def open_text(path, mode='r', newline=None, codec=None):
+    """Open a text file, (de)compressing it when the extension (or `codec`) says .gz / .zst"""
+    codec = codec or _codec(path)
+    if codec == 'gz':
+        if 'w' in mode:
+            # No timestamp in the header, so unchanged exports compress to the same bytes
+            stream = gzip.GzipFile(path, mode + 'b', compresslevel=6, mtime=0)
+            return io.TextIOWrapper(stream, encoding='utf-8', newline=newline)
+        return gzip.open(path, mode + 't', encoding='utf-8', newline=newline)
+    if codec == 'zst':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(f"Reading or writing {path} requires zstandard (pip install zstandard)")
+        raw = open(path, mode + 'b')
+        if 'w' in mode:
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding='utf-8', newline=newline)
+    return open(path, mode, encoding='utf-8', newline=newline)
+
+
+def export_name(path):
+    """Base name of an export file without its format extensions ('Resistors-FOJAN')"""
+    name = os.path.basename(path)
+    for extension in sorted(JSON_FORMATS + ('csv', 'parquet'), key=len, reverse=True):
+        if name.endswith('.' + extension):
+            return name[:-len(extension) - 1]
+    return os.path.splitext(name)[0]
+
+
+def find_export(folder, name):
+    """Path of the newest JSON export of `name` in any format (the .json path if there is none)"""
+    paths = [os.path.join(folder, f'{name}.{extension}') for extension in JSON_FORMATS]
+    existing = [path for path in paths if os.path.exists(path)]
+    return max(existing, key=os.path.getmtime) if existing else paths[0]
+
+
+def _iter_json_array(f, chunk_size=1 << 16):
+    # Decode one array element at a time instead of json.load-ing the whole file
+    decoder = json.JSONDecoder(object_pairs_hook=Product)
+    buffer = f.read(chunk_size).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError(f"{getattr(f, 'name', 'file')} is not a JSON array")
+    position = 1
+    eof = False
+    while True:
+        position = _WHITESPACE_RE.match(buffer, position).end()
+        if buffer.startswith(']', position):
+            return
+        try:
+            product, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            more = f.read(chunk_size)
+            eof = not more
+            buffer = buffer[position:] + more
+            position = 0
+            continue
+        yield product
+
+
+def iter_products(path):
+    """Yield the products of a JSON, JSON Lines or Parquet export one at a time (format from the extension)"""
+    if path.endswith('.parquet'):
+        from lcsc_parquet import iter_products as iter_parquet
+        yield from iter_parquet(path)
+        return
+    with open_text(path) as f:
+        if '.jsonl' in os.path.basename(path):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line, object_pairs_hook=Product)
+        else:
+            yield from _iter_json_array(f)
+
+
+def file_hash(path):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def commit_file(part_path, path):
+    """Move a finished part file over `path`, unless `path` already holds the same bytes.
+
+    Returns True if the file was replaced; an unchanged file keeps its mtime.
+    """
+    if (os.path.exists(path) and os.path.getsize(path) == os.path.getsize(part_path)
+            and file_hash(path) == file_hash(part_path)):
+        os.remove(part_path)
+        return False
+    os.replace(part_path, path)
+    return True
+
+
+def write_concurrently(writers, products, batch_size=1000):
+    """Hand the same product batches to every writer, each on its own thread.
+
+    Returns one exception (or None) per writer. A writer that failed keeps
+    draining its queue so the others are never blocked.
+    """
+    queues = [queue.Queue(maxsize=4) for _ in writers]
+
+    def drain(writer, batches):
+        error = None
+        while (batch := batches.get()) is not None:
+            if error is None:
+                try:
+                    writer.write(batch)
+                except Exception as e:
+                    error = e
+        return error
+
+    with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+        futures = [executor.submit(drain, writer, batches) for writer, batches in zip(writers, queues)]
+        try:
+            for start in range(0, len(products), batch_size):
+                batch = products[start:start + batch_size]
+                for batches in queues:
+                    batches.put(batch)
+        finally:
+            for batches in queues:
+                batches.put(None)
+    return [future.result() for future in futures]
+
+
+def csv_row(product, fields):
+    """Map a product to a CSV row ('Description' comes from the 'description' key)"""
+    row = {field: product.get(field, '') for field in fields}
+    if 'Description' in row:
+        row['Description'] = product.get('description', '')
+    return row
+
+
+class _PartFileWriter:
+    """Write to '<path>.part' and move it into place on commit (see commit_file)"""
+
+    newline = None
+
+    def __init__(self, path):
+        self.path = path
+        self.part_path = path + '.part'
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.file = open_text(self.part_path, 'w', newline=self.newline, codec=_codec(path))
+        self.count = 0
+        self.changed = None
+
+    def write(self, products):
+        raise NotImplementedError
+
+    def flush(self):
+        """Hand the rows written so far to the OS (ProductStream does this after every page)"""
+        self.file.flush()
+
+    def finish(self):
+        """Write any closing bytes before the file is committed"""
+
+    def close(self, commit=True):
+        """Commit the finished file, or drop the partial one; returns True on success"""
+        try:
+            if commit:
+                self.finish()
+            self.file.close()
+            if commit:
+                self.changed = commit_file(self.part_path, self.path)
+                return True
+        except OSError as e:
+            print(f"✗ Error writing {self.path}: {e}")
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+        return False
+
+
+class JsonArrayWriter(_PartFileWriter):
+    """Stream products into a JSON array, byte-identical to json.dump(products, indent=2)"""
+
+    label = 'JSON'
+
+    def write(self, products):
+        for product in products:
+            text = json.dumps(product, indent=2, ensure_ascii=False, default=json_default).replace('\n', '\n  ')
+            self.file.write(('[\n  ' if self.count == 0 else ',\n  ') + text)
+            self.count += 1
+
+    def finish(self):
+        self.file.write('\n]' if self.count else '[]')
+
+
+class JsonLinesWriter(_PartFileWriter):
+    """Stream products as JSON Lines, one compact object per line"""
+
+    label = 'JSONL'
+    newline = '\n'
+
+    def write(self, products):
+        for product in products:
+            self.file.write(json.dumps(product, ensure_ascii=False, default=json_default) + '\n')
+            self.count += 1
+
+
+def json_writer(path):
+    """JsonLinesWriter for .jsonl[.gz|.zst] paths, JsonArrayWriter otherwise"""
+    return JsonLinesWriter(path) if '.jsonl' in os.path.basename(path) else JsonArrayWriter(path)
+
+
+class CsvRowWriter(_PartFileWriter):
+    """Stream products into a CSV file with a fixed column order"""
+
+    label = 'CSV'
+    newline = ''
+
+    def __init__(self, path, fields):
+        super().__init__(path)
+        self.fields = fields
+        self.writer = csv.DictWriter(self.file, fieldnames=fields)
+        self.writer.writeheader()
+
+    def write(self, products):
+        for product in products:
+            self.writer.writerow(csv_row(product, self.fields))
+            self.count += 1
+
+
+class ProductSummary:
+    """Field completion counts and the first few products, without keeping the rest"""
+
+    def __init__(self, fields, keep=3):
+        self.fields = fields
+        self.keep = keep
+        self.count = 0
+        self.filled = dict.fromkeys(fields, 0)
+        self.first = []
+
+    def write(self, products):
+        for product in products:
+            self.count += 1
+            for field in self.fields:
+                if product.get(field):
+                    self.filled[field] += 1
+            if len(self.first) < self.keep:
+                self.first.append(product)
+
+    def close(self, commit=True):
+        return True
+
+
+class ProductStream:
+    """Fan product batches out to writers as the crawl produces them"""
+
+    def __init__(self, writers, enrich=None):
+        self.writers = writers
+        self.enrich = enrich
+        self.count = 0
+        self.results = []
+
+    def write(self, products):
+        """Hand one page's new unique products to every writer"""
+        if not products:
+            return
+        if self.enrich:
+            self.enrich(products)
+        for writer in self.writers:
+            writer.write(products)
+            # The page is on disk before its checkpoint is recorded
+            if hasattr(writer, 'flush'):
+                writer.flush()
+        self.count += len(products)
+
+    def close(self, commit=True):
+        """Commit (or discard) every file; returns True if all of them succeeded"""
+        self.results = [(writer, writer.close(commit)) for writer in self.writers]
+        return all(success for _, success in self.results)
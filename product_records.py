@@ -0,0 +1,167 @@
+"""
+Compact product records for the scrapers and the Altium generators.
+
+A product used to be a plain dict: every record carried its own hash
+table, and values such as '0603', '±1%' or '75V' were separate string
+objects in every record. A Product stores only a reference to a shared
+key layout and a tuple of values, and interns the categorical values, so
+5000 resistors share a handful of '0603' / '±1%' strings:
+
+    product = Product({'Manufacturer Part Number': 'FRC0603F1002TS', 'Package': '0603'})
+    product['Package'], product.get('Power', ''), dict(product)
+
+Product is a MutableMapping, so code reading products like dicts keeps
+working. JSON needs plain dicts: pass default=json_default to json.dump(s),
+or load straight into records with json.load(f, object_pairs_hook=Product).
+
+Compare the memory of dicts and Products with:
+
+    python product_records.py benchmark [5000 100000 1000000]
+"""
+import sys
+from collections.abc import MutableMapping
+
+# Fields with few distinct values, stored as interned strings
+CATEGORICAL_FIELDS = frozenset({
+    'Package', 'Resistance', 'Capacitance', 'Tolerance', 'Voltage Rating', 'Power',
+    'Temperature Coefficient',
+})
+
+
+class _Layout:
+    """Key order shared by every Product with the same fields"""
+
+    __slots__ = ('keys', 'index')
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = {key: position for position, key in enumerate(keys)}
+
+
+_LAYOUTS = {}
+
+
+def _layout(keys):
+    layout = _LAYOUTS.get(keys)
+    if layout is None:
+        layout = _LAYOUTS[keys] = _Layout(tuple(sys.intern(key) for key in keys))
+    return layout
+
+
+def _value(key, value):
+    if key in CATEGORICAL_FIELDS and type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class Product(MutableMapping):
+    """Slotted product record: a shared key layout plus a tuple of values"""
+
+    __slots__ = ('_layout', '_values')
+
+    def __init__(self, data=()):
+        pairs = data.items() if isinstance(data, (dict, Product)) else data
+        keys = []
+        values = []
+        for key, value in pairs:
+            keys.append(key)
+            values.append(_value(key, value))
+        self._layout = _layout(tuple(keys))
+        self._values = tuple(values)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Return data as a Product (Products are returned unchanged)"""
+        return data if isinstance(data, cls) else cls(data)
+
+    def __getitem__(self, key):
+        return self._values[self._layout.index[key]]
+
+    def get(self, key, default=None):
+        # Mapping.get goes through __getitem__ and a KeyError for every missing field
+        position = self._layout.index.get(key)
+        return default if position is None else self._values[position]
+
+    def __setitem__(self, key, value):
+        position = self._layout.index.get(key)
+        if position is None:
+            self._layout = _layout(self._layout.keys + (key,))
+            self._values = self._values + (_value(key, value),)
+        else:
+            values = list(self._values)
+            values[position] = _value(key, value)
+            self._values = tuple(values)
+
+    def __delitem__(self, key):
+        position = self._layout.index[key]
+        keys = self._layout.keys
+        self._layout = _layout(keys[:position] + keys[position + 1:])
+        self._values = self._values[:position] + self._values[position + 1:]
+
+    def __iter__(self):
+        return iter(self._layout.keys)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._layout.index
+
+    def __repr__(self):
+        return f'Product({self.to_dict()!r})'
+
+    def __reduce__(self):
+        return Product, (list(zip(self._layout.keys, self._values)),)
+
+    def to_dict(self):
+        """Return the record as a plain dict (same key order)"""
+        return dict(zip(self._layout.keys, self._values))
+
+
+def json_default(obj):
+    """json.dump(s) default= hook writing Products like the dicts they replace"""
+    if isinstance(obj, Product):
+        return obj.to_dict()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def synthetic_products(templates, count):
+    """count dicts cycling through templates, with fresh strings like json.load creates"""
+    for number in range(count):
+        template = templates[number % len(templates)]
+        product = {}
+        for key, value in template.items():
+            if type(value) is str:
+                # Unique identifiers per part, copies of everything else
+                value = f'{value}-{number}' if key in ('Manufacturer Part Number', 'Supplier Part Number') \
+                    else (value + '.')[:-1]
+            product[key] = value
+        yield product
+
+
+def benchmark(counts, snapshot):
+    """Print the traced memory of `count` products as dicts and as Products"""
+    import json
+    import tracemalloc
+
+    with open(snapshot, 'r', encoding='utf-8') as f:
+        templates = json.load(f)
+    print(f"Templates: {len(templates)} products from {snapshot}")
+    print(f"{'parts':>9} {'dicts':>10} {'Products':>10} {'saved':>7}")
+    for count in counts:
+        sizes = []
+        for build in (list, lambda products: [Product(product) for product in products]):
+            tracemalloc.start()
+            products = build(synthetic_products(templates, count))
+            sizes.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.stop()
+            del products
+        print(f"{count:>9} {sizes[0] / 1e6:>8.1f}MB {sizes[1] / 1e6:>8.1f}MB {1 - sizes[1] / sizes[0]:>6.0%}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != 'benchmark':
+        print("Usage: python product_records.py benchmark [count ...]")
+        sys.exit(1)
+    benchmark([int(count) for count in sys.argv[2:]] or [5000, 100000, 1000000],
+              'Outputs/JSONs/Resistors-FOJAN.json')
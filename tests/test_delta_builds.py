@@ -0,0 +1,76 @@
+"""
+Filtered library builds: a --package build between two full builds must not
+replace the full library file, nor change what the next --delta build reports.
+
+Runs the generator scripts on the first parts of the committed JSON exports
+in a temporary folder:
+
+    python -m unittest discover tests
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GENERATORS = (
+    ('Resistors', 'Resistors-FOJAN', 'altium scripting [RESs].py'),
+    ('Capacitors', 'Capacitors-FOJAN', 'altium scripting [CAPs].py'),
+)
+
+
+class DeltaBuildTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+
+    def copy_export(self, export, count=60):
+        """Put the first parts of a committed JSON export into the build folder; returns them"""
+        with open(os.path.join(ROOT, 'Outputs', 'JSONs', f'{export}.json'), encoding='utf-8') as f:
+            products = json.load(f)[:count]
+        os.makedirs(os.path.join(self.folder, 'Outputs', 'JSONs'), exist_ok=True)
+        with open(os.path.join(self.folder, 'Outputs', 'JSONs', f'{export}.json'), 'w', encoding='utf-8') as f:
+            json.dump(products, f, ensure_ascii=False)
+        return products
+
+    def components(self, name):
+        with open(os.path.join(self.folder, 'Outputs', 'Components', name), encoding='utf-8') as f:
+            return f.read().count('Component (Name')
+
+    def build(self, script, *args):
+        result = subprocess.run([sys.executable, os.path.join(ROOT, script), '--source', 'json', *args],
+                                cwd=self.folder, capture_output=True, text=True, encoding='utf-8')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout
+
+    def test_filtered_build_keeps_the_full_manifest(self):
+        for library, export, script in GENERATORS:
+            with self.subTest(library=library):
+                products = self.copy_export(export)
+                self.assertIn(f'Delta: {len(products)} added', self.build(script, '--delta'))
+                self.build(script, '--package', '0603')
+                output = self.build(script, '--delta')
+                self.assertIn('Delta: 0 added, 0 changed, 0 removed', output)
+
+                self.assertEqual(self.components(f'{library}.delta.txt'), 0)
+                removed = os.path.join(self.folder, 'Outputs', 'Components', f'{library}.removed.txt')
+                self.assertEqual(os.path.getsize(removed), 0)
+
+    def test_filtered_build_keeps_the_full_library(self):
+        for library, export, script in GENERATORS:
+            with self.subTest(library=library):
+                products = self.copy_export(export)
+                self.build(script)
+                self.build(script, '--package', '0603', '--tolerance', '1')
+                self.assertEqual(self.components(f'{library}.txt'), len(products))
+                selected = [product for product in products
+                            if product.get('Package') == '0603' and product.get('Tolerance') == '±1%']
+                self.assertEqual(self.components(f'{library}.0603-1%.txt'), len(selected))
+
+
+if __name__ == "__main__":
+    unittest.main()
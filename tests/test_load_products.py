@@ -0,0 +1,73 @@
+"""
+Source selection of lcsc_catalog.load_products: the catalog is only read
+while the JSON export is not newer than its last saved crawl.
+
+    python -m unittest discover tests
+"""
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lcsc_catalog import Catalog, import_json, load_products
+
+
+class LoadProductsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.catalog_path = os.path.join(self.folder, 'catalog.sqlite')
+        self.json_path = os.path.join(self.folder, 'JSONs', 'Resistors-FOJAN.json')
+        os.makedirs(os.path.dirname(self.json_path))
+
+    def write_export(self, parts):
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump([{'Supplier Part Number': part, 'Package': '0603'} for part in parts], f)
+
+    def parts(self, **options):
+        with contextlib.redirect_stdout(io.StringIO()):
+            products = load_products('Resistors', self.json_path, catalog_path=self.catalog_path, **options)
+            return [product['Supplier Part Number'] for product in products]
+
+    def test_catalog_of_the_last_crawl(self):
+        self.write_export(['C1', 'C2'])
+        with contextlib.redirect_stdout(io.StringIO()):
+            import_json(self.json_path, 'Resistors', 'FOJAN', self.catalog_path)
+        # Export written before the import: the catalog is read
+        catalog = Catalog(self.catalog_path)
+        catalog.upsert('Resistors', [('C3', 'FOJAN', 2, 0, None, '0603', None, None, None, None,
+                                      json.dumps({'Supplier Part Number': 'C3'}))])
+        catalog.close()
+        self.assertEqual(self.parts(), ['C1', 'C2', 'C3'])
+
+    def test_newer_export_skips_the_catalog(self):
+        self.write_export(['C1', 'C2'])
+        with contextlib.redirect_stdout(io.StringIO()):
+            import_json(self.json_path, 'Resistors', 'FOJAN', self.catalog_path)
+        # A later crawl without the catalog
+        self.write_export(['C1', 'C4'])
+        later = time.time() + 10
+        os.utime(self.json_path, (later, later))
+        self.assertEqual(self.parts(), ['C1', 'C4'])
+        self.assertEqual(self.parts(source='catalog'), ['C1', 'C2'])
+
+    def test_catalog_without_saved_crawl(self):
+        catalog = Catalog(self.catalog_path)
+        catalog.upsert('Resistors', [('C1', 'FOJAN', 0, 0, None, '0603', None, None, None, None,
+                                      json.dumps({'Supplier Part Number': 'C1'}))])
+        catalog.close()
+        self.assertEqual(self.parts(), ['C1'])
+        self.write_export(['C5'])
+        self.assertEqual(self.parts(), ['C5'])
+
+
+if __name__ == "__main__":
+    unittest.main()